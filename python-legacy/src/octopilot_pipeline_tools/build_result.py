@@ -2,52 +2,120 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import re
+import string
 import subprocess
 import sys
+from collections import deque
 from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup (pip install octopilot-pipeline-tools[fast])
+    orjson = None
 
 BUILD_RESULT_FILENAME = "build_result.json"
 
+# Max concurrent crane/docker copies when adding :latest tags.
+_LATEST_TAG_WORKERS = 8
+
+# Lines of skaffold output kept for tag parsing when not using --file-output (tags are logged at the end).
+_OUTPUT_TAIL_LINES = 512
+
+# Trailing characters of output searched first by the fallbacks in parse_skaffold_output_for_tag.
+_PARSE_TAIL_CHARS = 64 * 1024
+
+# Fallback patterns for skaffold/pack output when no image_pattern matches (tried in order,
+# then any generic "<name>:<tag>" token via _find_generic_ref).
+_FALLBACK_PATTERNS = (
+    re.compile(r"Tagged .+ as (?P<ref>[^\s]+)"),
+    re.compile(r"Built .+ -> (?P<ref>[^\s]+)"),
+)
+
+# Character classes for _find_generic_ref (ASCII only, as in the equivalent regex).
+_REF_ALNUM = frozenset(string.ascii_letters + string.digits)
+_REF_NAME_CHARS = _REF_ALNUM | frozenset("._/-")
+_REF_TAG_CHARS = _REF_ALNUM | frozenset("._-")
+
+
+def _loads(raw: bytes) -> Any:
+    """Parse JSON bytes (orjson when installed, else stdlib json)."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to compact JSON bytes, as skaffold --file-output does (same output with or without orjson)."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
 
 def _ref_to_latest_ref(ref: str) -> str:
     """Convert image ref (repo/image:tag) to same ref with tag 'latest'."""
-    if ":" not in ref:
-        return f"{ref}:latest"
-    return ref.rsplit(":", 1)[0] + ":latest"
+    head, sep, _ = ref.rpartition(":")
+    return f"{head if sep else ref}:latest"
+
+
+def _copy_one_to_latest(ref: str, cwd: Path) -> None:
+    """Push ref's digest with tag 'latest' (crane copy, or docker pull/tag/push fallback)."""
+    latest_ref = _ref_to_latest_ref(ref)
+    # Prefer crane (works for multi-arch); fallback to docker tag + push.
+    # Output is only needed to explain failures, so stdout is discarded and stderr kept as bytes.
+    proc = subprocess.run(
+        ["crane", "copy", ref, latest_ref],
+        cwd=cwd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    )
+    if proc.returncode != 0:
+        # Fallback: docker pull, tag, push (single-arch)
+        proc2 = subprocess.run(
+            ["docker", "pull", ref],
+            cwd=cwd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+        if proc2.returncode != 0:
+            detail = (proc2.stderr or proc.stderr or b"").decode(errors="replace").strip()
+            sys.stderr.write(
+                f"Could not add latest tag: crane copy failed and docker pull failed for {ref}"
+                + (f": {detail}" if detail else "")
+                + "\n"
+            )
+            return
+        proc3 = subprocess.run(
+            ["docker", "tag", ref, latest_ref],
+            cwd=cwd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        if proc3.returncode != 0:
+            return
+        subprocess.run(["docker", "push", latest_ref], cwd=cwd, check=False)
 
 
 def _add_latest_tags(cwd: Path) -> None:
-    """For each image in build_result.json, push the same digest with tag 'latest' (crane copy or docker)."""
+    """For each image in build_result.json, push the same digest with tag 'latest' (crane copy or docker).
+
+    Images are independent registry round-trips, so they are copied concurrently (up to 8 at a time).
+    """
     data = read_build_result(cwd=cwd)
+    refs = []
     for b in data.get("builds") or []:
         ref = b.get("tag") if isinstance(b, dict) else (b if isinstance(b, str) else None)
-        if not ref or ":" not in ref:
-            continue
-        latest_ref = _ref_to_latest_ref(ref)
-        # Prefer crane (works for multi-arch); fallback to docker tag + push
-        proc = subprocess.run(
-            ["crane", "copy", ref, latest_ref],
-            cwd=cwd,
-            capture_output=True,
-            text=True,
-        )
-        if proc.returncode != 0:
-            # Fallback: docker pull, tag, push (single-arch)
-            proc2 = subprocess.run(
-                ["docker", "pull", ref],
-                cwd=cwd,
-                capture_output=True,
-                text=True,
-            )
-            if proc2.returncode != 0:
-                sys.stderr.write(f"Could not add latest tag: crane copy failed and docker pull failed for {ref}\n")
-                continue
-            proc3 = subprocess.run(["docker", "tag", ref, latest_ref], cwd=cwd, capture_output=True, text=True)
-            if proc3.returncode != 0:
-                continue
-            subprocess.run(["docker", "push", latest_ref], cwd=cwd, check=False)
+        if ref and ":" in ref:
+            refs.append(ref)
+    if not refs:
+        return
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(_LATEST_TAG_WORKERS, len(refs))) as pool:
+        list(pool.map(lambda ref: _copy_one_to_latest(ref, cwd), refs))
 
 
 def build_result_path(cwd: Path | None = None) -> Path:
@@ -57,9 +125,11 @@ def build_result_path(cwd: Path | None = None) -> Path:
 def read_build_result(cwd: Path | None = None) -> dict:
     """Read build_result.json; raise if missing or invalid."""
     path = build_result_path(cwd)
-    if not path.exists():
-        raise FileNotFoundError(f"{path} not found. Run 'push' first.")
-    data = json.loads(path.read_text())
+    try:
+        raw = path.read_bytes()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"{path} not found. Run 'push' first.") from None
+    data = _loads(raw)
     if "builds" not in data or not data["builds"]:
         raise ValueError(f"{path}: expected 'builds' list with at least one entry")
     return data
@@ -75,18 +145,38 @@ def get_first_tag(build_result: dict) -> str:
     raise ValueError("builds[0] must have 'tag' or be a string")
 
 
+def build_tag_index(build_result: dict) -> dict[str, str]:
+    """
+    Map image name (last path segment before ':') to full tag for every build, first entry wins.
+    Build once when looking up several images; e.g. 'localhost:5001/sample-react-node-api:latest'
+    is indexed under 'sample-react-node-api'.
+    """
+    index: dict[str, str] = {}
+    for b in build_result.get("builds") or []:
+        tag = b.get("tag") if isinstance(b, dict) else (b if isinstance(b, str) else None)
+        if not tag:
+            continue
+        # Last segment is "image_name:tag" (tag may carry @sha256:digest, so split on the first ':')
+        name, sep, _ = tag.rpartition("/")[2].partition(":")
+        if sep:
+            index.setdefault(name, tag)
+    return index
+
+
 def find_tag_for_image(build_result: dict, image_name: str) -> str | None:
     """
     Return the full tag from build_result for the given image name, or None.
     Tags are like 'localhost:5001/sample-react-node-api:latest'; image_name is 'sample-react-node-api'.
+    Stops at the first match; use build_tag_index when looking up several images.
     """
+    n = len(image_name)
     for b in build_result.get("builds") or []:
         tag = b.get("tag") if isinstance(b, dict) else (b if isinstance(b, str) else None)
         if not tag:
             continue
         # Last segment is "image_name:tag"
-        suffix = tag.split("/")[-1]
-        if suffix.startswith(image_name + ":"):
+        suffix = tag.rpartition("/")[2]
+        if len(suffix) > n and suffix[n] == ":" and suffix.startswith(image_name):
             return tag
     return None
 
@@ -94,22 +184,63 @@ def find_tag_for_image(build_result: dict, image_name: str) -> str | None:
 def write_build_result(builds: list[dict], cwd: Path | None = None) -> Path:
     """Write build_result.json. Each build: { 'tag': 'image:tag' } or { 'imageName', 'tag' }."""
     path = build_result_path(cwd)
-    path.write_text(json.dumps({"builds": builds}, indent=2))
+    path.write_bytes(_dumps({"builds": builds}))
     return path
 
 
+def _find_generic_ref(line: str) -> str | None:
+    """
+    Leftmost "<name>:<tag>" token in line, matching exactly what
+    r"[a-zA-Z0-9][a-zA-Z0-9._/-]+:[a-zA-Z0-9][a-zA-Z0-9._-]+" would, but jumping between ':'
+    with str.find so the (typical) non-matching log line costs no regex scan.
+    """
+    n = len(line)
+    colon = line.find(":")
+    while colon >= 0:
+        # Name: maximal run of name chars ending at the colon, starting at its first alnum.
+        start = colon
+        while start > 0 and line[start - 1] in _REF_NAME_CHARS:
+            start -= 1
+        while start < colon - 1 and line[start] not in _REF_ALNUM:
+            start += 1
+        if (
+            colon - start >= 2
+            and line[start] in _REF_ALNUM
+            and colon + 2 < n
+            and line[colon + 1] in _REF_ALNUM
+            and line[colon + 2] in _REF_TAG_CHARS
+        ):
+            end = colon + 3
+            while end < n and line[end] in _REF_TAG_CHARS:
+                end += 1
+            return line[start:end]
+        colon = line.find(":", colon + 1)
+    return None
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_image_pattern(pattern: str) -> re.Pattern[str]:
+    return re.compile(pattern)
+
+
+def _image_regex(pattern: str | re.Pattern[str]) -> re.Pattern[str]:
+    """Return pattern as a compiled regex; callers may pass one precompiled."""
+    return pattern if isinstance(pattern, re.Pattern) else _compile_image_pattern(pattern)
+
+
 def parse_skaffold_output_for_tag(
     stdout: str,
     *,
-    image_pattern: str | None = None,
+    image_pattern: str | re.Pattern[str] | None = None,
 ) -> list[dict]:
     """
     Parse skaffold build output to extract image tags.
-    If image_pattern is given, use regex with group 'image' and 'tag'; else use Skaffold --file-output.
+    If image_pattern (a regex string or compiled pattern) is given, use its groups 'image' and 'tag';
+    else use Skaffold --file-output.
     Fallback: look for last "Tagged ... as <repo>/<image>:<tag>" or "Built ... -> <image>:<tag>".
     """
     if image_pattern:
-        rx = re.compile(image_pattern)
+        rx = _image_regex(image_pattern)
         builds = []
         for line in stdout.splitlines():
             m = rx.search(line)
@@ -121,23 +252,68 @@ def parse_skaffold_output_for_tag(
                     builds.append({"tag": f"{image}:{tag}"})
         if builds:
             return builds
-    # Fallback: common Skaffold/pack output patterns
-    for pattern in [
-        r"Tagged .+ as (?P<ref>[^\s]+)",
-        r"Built .+ -> (?P<ref>[^\s]+)",
-        r"(?P<ref>[a-zA-Z0-9][a-zA-Z0-9._/-]+:[a-zA-Z0-9][a-zA-Z0-9._-]+)",
-    ]:
-        rx = re.compile(pattern)
-        for line in reversed(stdout.splitlines()):
-            m = rx.search(line)
-            if m:
-                ref = m.group("ref" if "ref" in rx.groupindex else 0).strip()
-                if "/" in ref or ":" in ref:
-                    builds = [{"tag": ref}]
-                    return builds
+    # Fallback: common Skaffold/pack output patterns, wanted from the last matching line. Tags are
+    # logged at the end, so search the trailing whole lines first and only then the rest.
+    cut = stdout.find("\n", len(stdout) - _PARSE_TAIL_CHARS) + 1 if len(stdout) > _PARSE_TAIL_CHARS else 0
+    chunks = (stdout[cut:], stdout[:cut]) if cut else (stdout,)
+    for rx in _FALLBACK_PATTERNS:
+        for chunk in chunks:
+            # Each pattern matches within one line, so one finditer pass finds the last match.
+            ref = None
+            for m in rx.finditer(chunk):
+                candidate = m.group("ref").strip()
+                if "/" in candidate or ":" in candidate:
+                    ref = candidate
+            if ref:
+                return [{"tag": ref}]
+    for chunk in chunks:
+        for line in reversed(chunk.splitlines()):
+            ref = _find_generic_ref(line)
+            if ref:
+                return [{"tag": ref}]
     return []
 
 
+def _stream_build_output(cmd: list[str], cwd: Path, image_pattern: str | re.Pattern[str] | None) -> tuple[int, str]:
+    """
+    Run cmd, echoing its combined stdout/stderr to our stderr as it arrives.
+    Returns (returncode, text to parse): the last _OUTPUT_TAIL_LINES lines, preceded by any
+    earlier lines that matched image_pattern, so memory stays bounded on long builds.
+    Output is passed through as bytes; only the text to parse is decoded (invalid UTF-8 replaced).
+    """
+    rx = _image_regex(image_pattern) if image_pattern else None
+    kept: list[bytes] = []
+    tail: deque[bytes] = deque(maxlen=_OUTPUT_TAIL_LINES)
+    echo = getattr(sys.stderr, "buffer", None)
+    sys.stderr.flush()
+    proc = subprocess.Popen(cmd, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    assert proc.stdout is not None
+    for line in proc.stdout:
+        if echo is not None:
+            echo.write(line)
+            echo.flush()
+        else:
+            sys.stderr.write(line.decode(errors="replace"))
+        if len(tail) == tail.maxlen and rx is not None and rx.search(tail[0].decode(errors="replace")):
+            kept.append(tail[0])
+        tail.append(line)
+    proc.stdout.close()
+    proc.wait()
+    return proc.returncode, b"".join([*kept, *tail]).decode(errors="replace")
+
+
+def _norm_build(b: Any, default_repo: str) -> dict[str, str]:
+    """Normalize one Skaffold --file-output build entry to { "tag": "<ref>" }."""
+    if not isinstance(b, dict):
+        return {"tag": str(b)}
+    if "tag" in b and ":" in str(b["tag"]):
+        return {"tag": b["tag"]}
+    if "imageName" in b and "tag" in b:
+        return {"tag": f"{b['imageName']}:{b['tag']}"}
+    img, t = b.get("imageName", "app"), b.get("tag", "latest")
+    return {"tag": f"{default_repo}/{img}:{t}"}
+
+
 def run_skaffold_build_push(
     *,
     default_repo: str,
@@ -145,7 +321,7 @@ def run_skaffold_build_push(
     cwd: Path | None = None,
     skaffold_cmd: str = "skaffold",
     skaffold_file: Path | None = None,
-    image_pattern: str | None = None,
+    image_pattern: str | re.Pattern[str] | None = None,
     use_file_output: bool = True,
     push: bool = False,
     cache_artifacts: bool = True,
@@ -162,8 +338,8 @@ def run_skaffold_build_push(
     Skaffold builds all artifacts (docker + buildpacks) in one invocation.
     """
     cwd = cwd or Path.cwd()
+    out_path = build_result_path(cwd)
     if use_file_output:
-        out_path = cwd / BUILD_RESULT_FILENAME
         cmd = [skaffold_cmd, "build"]
         if skaffold_file is not None:
             cmd.extend(["-f", str(skaffold_file)])
@@ -187,28 +363,19 @@ def run_skaffold_build_push(
         if proc.returncode != 0:
             raise SystemExit(proc.returncode)
         # Skaffold --file-output format may differ; normalize to { "builds": [ { "tag": "..." } ] }
-        data = json.loads(out_path.read_text())
+        data = _loads(out_path.read_bytes())
         if data.get("builds"):
-            normalized = []
-            for b in data["builds"]:
-                if isinstance(b, dict):
-                    if "tag" in b and ":" in str(b["tag"]):
-                        normalized.append({"tag": b["tag"]})
-                    elif "imageName" in b and "tag" in b:
-                        normalized.append({"tag": f"{b['imageName']}:{b['tag']}"})
-                    else:
-                        img, t = b.get("imageName", "app"), b.get("tag", "latest")
-                        normalized.append({"tag": f"{default_repo}/{img}:{t}"})
-                else:
-                    normalized.append({"tag": str(b)})
-            out_path.write_text(json.dumps({"builds": normalized}, indent=2))
+            normalized = [_norm_build(b, default_repo) for b in data["builds"]]
+            # Already { "builds": [ { "tag": "..." } ] }: leave the file as skaffold wrote it
+            if data != {"builds": normalized}:
+                out_path.write_bytes(_dumps({"builds": normalized}))
         elif "image" in data or "tag" in data:
             img, t = data.get("image", "app"), data.get("tag", "latest")
-            out_path.write_text(json.dumps({"builds": [{"tag": f"{default_repo}/{img}:{t}"}]}, indent=2))
+            out_path.write_bytes(_dumps({"builds": [{"tag": f"{default_repo}/{img}:{t}"}]}))
         if push and add_latest:
             _add_latest_tags(cwd)
         return out_path
-    # No --file-output: run skaffold build and parse stdout
+    # No --file-output: run skaffold build, stream its output and parse the tail
     cmd = [skaffold_cmd, "build"]
     if skaffold_file is not None:
         cmd.extend(["-f", str(skaffold_file)])
@@ -221,18 +388,14 @@ def run_skaffold_build_push(
         cmd.extend(["--tag", tag])
     if profile:
         cmd.extend(["--profile", profile])
-    proc = subprocess.run(cmd, cwd=cwd, capture_output=True, text=True)
-    stdout = proc.stdout or ""
-    stderr = proc.stderr or ""
-    if proc.returncode != 0:
-        sys.stderr.write(stderr)
-        sys.stderr.write(stdout)
-        raise SystemExit(proc.returncode)
-    builds = parse_skaffold_output_for_tag(stdout + "\n" + stderr, image_pattern=image_pattern)
+    returncode, output = _stream_build_output(cmd, cwd, image_pattern)
+    if returncode != 0:
+        raise SystemExit(returncode)
+    builds = parse_skaffold_output_for_tag(output, image_pattern=image_pattern)
     if not builds:
         sys.stderr.write("Could not parse image tag from skaffold output. Use --file-output or set image-pattern.\n")
         raise SystemExit(1)
     write_build_result(builds, cwd=cwd)
     if push and add_latest:
         _add_latest_tags(cwd)
-    return build_result_path(cwd)
+    return out_path
@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+import functools
+import os
+import random
+import re
+import shutil
 import subprocess
 import sys
 import time
@@ -43,10 +48,59 @@ from .start_registry import (
 )
 from .tag_resolution import resolve_build_tag
 
+# Default max concurrent crane copies for push --push-all (--max-parallel-copies).
+_CRANE_COPY_WORKERS = 8
+
+# watch-deployment polls quickly at first (Flux often applies within seconds), backing off to this cap.
+_WATCH_POLL_INITIAL = 2.0
+_WATCH_POLL_MAX = 30.0
+# Each poll delay is scaled by a random factor in [1 - jitter, 1 + jitter] so concurrent watches spread out.
+_WATCH_POLL_JITTER = 0.1
+# Minimum seconds between flux reconcile calls while polling (a reconcile already in flight needs no nudge).
+_FLUX_RECONCILE_INTERVAL = 30.0
+
 # Single pull hint for start-registry success (registry.local is already required in /etc/hosts at entry).
 _REGISTRY_PULL_HINT = "To pull: docker pull registry.local:5001/<image> or host.docker.internal:5001/<image>."
 
 
+def _exec_tail(cmd: list[str]) -> None:
+    """Replace this process with cmd (its exit status becomes ours); on Windows, run it and exit instead.
+
+    Only for a command's final step: nothing after this call runs.
+    """
+    sys.stdout.flush()
+    sys.stderr.flush()
+    if os.name == "nt":
+        sys.exit(subprocess.run(cmd).returncode)
+    os.execvp(cmd[0], cmd)
+
+
+@functools.lru_cache(maxsize=16)
+def _which(name: str) -> str | None:
+    """Absolute path of tool name on PATH (None if missing), resolved once per process."""
+    return shutil.which(name)
+
+
+def _require_tools(*names: str) -> list[str]:
+    """Resolve each tool via _which, exiting with an error naming the first one not on PATH."""
+    paths = []
+    for name in names:
+        path = _which(name)
+        if path is None:
+            click.echo(f"::error ::{name} not found on PATH.", err=True)
+            sys.exit(1)
+        paths.append(path)
+    return paths
+
+
+def _build_result_dir(build_result: Path) -> Path:
+    """Directory to read build_result.json from for --build-result: its parent if it is a file, else cwd."""
+    if not build_result.parent.parts:
+        # Bare filename (the default): parent and cwd are the same directory, so skip the stat
+        return Path.cwd()
+    return build_result.parent if build_result.is_file() else Path.cwd()
+
+
 def _config_callback(ctx: click.Context, _param: click.Parameter, value: str | None) -> str | None:
     if value:
         path = Path(value)
@@ -93,9 +147,7 @@ def build_group(ctx: click.Context) -> None:
         if config.get(key):
             opt = key.replace("SKAFFOLD_", "").lower().replace("_", "-")
             cmd.extend([f"--{opt}", config[key]])
-    proc = subprocess.run(cmd, cwd=cwd)
-    if proc.returncode != 0:
-        sys.exit(proc.returncode)
+    _exec_tail(cmd)
 
 
 def _do_build_status(
@@ -113,7 +165,8 @@ def _do_build_status(
     if not skaffold_path.exists():
         click.echo(f"Skaffold file not found: {skaffold_path}", err=True)
         sys.exit(1)
-    out_dir = (output or cwd).resolve()
+    # Path.cwd() is already absolute and symlink-free; only a user-supplied --output needs resolving
+    out_dir = output.resolve() if output is not None else cwd
     path = run_skaffold_build_push(
         default_repo=effective_repo,
         cwd=out_dir,
@@ -245,7 +298,7 @@ def build_push(
     if not skaffold_path.exists():
         click.echo(f"Skaffold file not found: {skaffold_path}", err=True)
         sys.exit(1)
-    out_dir = (output or cwd).resolve()
+    out_dir = output.resolve() if output is not None else cwd
     path = run_skaffold_build_push(
         default_repo=effective_repo,
         cwd=out_dir,
@@ -281,7 +334,7 @@ def _run_docker_run(
     volumes: list[str],
 ) -> None:
     """Run docker run with the given image, ports, env, and volumes.
-    Streams container stdout/stderr directly so users see all output.
+    docker replaces this process, so it owns the terminal and signals (Ctrl-C) directly.
     """
     cmd = ["docker", "run", "--rm", "-it"]
     for p in ports:
@@ -292,14 +345,7 @@ def _run_docker_run(
         cmd.extend(["-v", v])
     cmd.append(image)
     click.echo("Running: " + " ".join(cmd), err=True)
-    proc = subprocess.run(
-        cmd,
-        stdin=sys.stdin,
-        stdout=sys.stdout,
-        stderr=sys.stderr,
-    )
-    if proc.returncode != 0:
-        sys.exit(proc.returncode)
+    _exec_tail(cmd)
 
 
 @main.command(
@@ -336,21 +382,18 @@ def run(
         sys.exit(0)
     cwd = Path.cwd()
     skaffold_path = cwd / skaffold_file if not skaffold_file.is_absolute() else skaffold_file
-    if not skaffold_path.exists():
-        click.echo(f"Skaffold file not found: {skaffold_path}", err=True)
-        sys.exit(1)
     try:
+        # Raises FileNotFoundError itself, so no separate exists() stat
         artifacts = parse_skaffold_artifacts(skaffold_path)
+    except FileNotFoundError:
+        click.echo(f"Skaffold file not found: {skaffold_path}", err=True)
+        sys.exit(1)
     except Exception as e:
         click.echo(f"Failed to read skaffold.yaml: {e}", err=True)
         sys.exit(1)
     if not artifacts:
         click.echo("No artifacts in skaffold.yaml.", err=True)
         sys.exit(1)
-    run_cfg = load_run_config(cwd)
-    config = ctx.obj["config"]
-    default_repo = _run_resolve_default_repo(cwd, config, run_cfg)
-    default_tag = run_cfg.get("tag") if isinstance(run_cfg.get("tag"), str) else "latest"
 
     if len(args) == 2 and args[0] == "context" and args[1] == "list":
         click.echo("Contexts (use: op run <context>):")
@@ -372,25 +415,28 @@ def run(
             sys.exit(1)
         art = match[0]
         image_name = art["image"]
+        # Only running a context needs .github/octopilot.yaml; context list stays a bare skaffold.yaml read
+        run_cfg = load_run_config(cwd)
         full_image: str | None = None
-        build_result_path = cwd / BUILD_RESULT_FILENAME
-        if build_result_path.exists():
-            try:
-                data = read_build_result(cwd)
-                full_image = find_tag_for_image(data, image_name)
-                if full_image is None:
-                    built = [b.get("tag", b) if isinstance(b, dict) else b for b in data.get("builds") or []]
-                    click.echo(
-                        f"Context '{context_name}' (image {image_name}) was not in the last build.\n"
-                        f"{BUILD_RESULT_FILENAME} contains: {', '.join(str(t) for t in built)}.\n"
-                        "Build this image with 'skaffold build' (all artifacts) or add it as a "
-                        "buildpacks artifact and run 'op build-push'.",
-                        err=True,
-                    )
-                    sys.exit(1)
-            except (ValueError, FileNotFoundError):
-                full_image = None
+        # A missing build_result.json raises FileNotFoundError: fall back to default repo/tag
+        try:
+            data = read_build_result(cwd)
+            full_image = find_tag_for_image(data, image_name)
+            if full_image is None:
+                built = [b.get("tag", b) if isinstance(b, dict) else b for b in data.get("builds") or []]
+                click.echo(
+                    f"Context '{context_name}' (image {image_name}) was not in the last build.\n"
+                    f"{BUILD_RESULT_FILENAME} contains: {', '.join(str(t) for t in built)}.\n"
+                    "Build this image with 'skaffold build' (all artifacts) or add it as a "
+                    "buildpacks artifact and run 'op build-push'.",
+                    err=True,
+                )
+                sys.exit(1)
+        except (ValueError, FileNotFoundError):
+            full_image = None
         if full_image is None:
+            default_repo = _run_resolve_default_repo(cwd, ctx.obj["config"], run_cfg)
+            default_tag = run_cfg.get("tag") if isinstance(run_cfg.get("tag"), str) else "latest"
             full_image = f"{default_repo}/{image_name}:{default_tag}"
         context_dir = cwd / art["context"]
         opts = get_run_options_for_context(context_name, cwd, config=run_cfg, context_dir=context_dir)
@@ -437,6 +483,13 @@ def run(
     is_flag=True,
     help="After push to first registry, crane copy to remaining CI destinations.",
 )
+@click.option(
+    "--max-parallel-copies",
+    type=click.IntRange(min=1),
+    default=_CRANE_COPY_WORKERS,
+    show_default=True,
+    help="With --push-all, max crane copies run at once (lower it for rate-limited registries).",
+)
 @click.option("--profile", default="push", help="Skaffold profile (e.g. push).")
 @click.option(
     "--output",
@@ -453,6 +506,7 @@ def push(
     destination: str,
     registry_file: Path | None,
     push_all: bool,
+    max_parallel_copies: int,
     profile: str | None,
     output: Path | None,
     no_file_output: bool,
@@ -472,7 +526,9 @@ def push(
     reg_path = (cwd / REGISTRY_FILENAME) if registry_file is None else registry_file
     if not default_repo:
         default_repo = get_default_repo(config)
-    if not default_repo and reg_path.exists():
+    # Only stat .registry when it will be read: no repo given yet, or --push-all needs its destinations
+    has_registry_file = (not default_repo or push_all) and reg_path.exists()
+    if not default_repo and has_registry_file:
         default_repo = get_default_repo_from_registry(repo_root=repo_root, destination=destination)
     if not default_repo:
         click.echo(
@@ -481,20 +537,25 @@ def push(
             err=True,
         )
         sys.exit(1)
+    try:
+        image_rx = re.compile(image_pattern) if image_pattern else None
+    except re.error as e:
+        click.echo(f"::error ::Invalid --image-pattern: {e}", err=True)
+        sys.exit(1)
     try:
         path = run_skaffold_build_push(
             default_repo=default_repo,
             profile=profile,
             cwd=cwd,
             use_file_output=not no_file_output,
-            image_pattern=image_pattern,
+            image_pattern=image_rx,
             push=True,
         )
         click.echo(f"Wrote {path}")
     except SystemExit as e:
         sys.exit(e.code)
     # Optional: push to remaining CI registries via crane copy
-    if push_all and reg_path.exists():
+    if push_all and has_registry_file:
         registries = get_push_registries(repo_root=repo_root, destination="ci")
         if len(registries) <= 1:
             return
@@ -505,13 +566,30 @@ def push(
             primary_ref = f"{default_repo}/{tag_str}" if "/" not in tag_str else tag_str
         else:
             primary_ref = f"{default_repo}/{tag_str}"
-        image_tag_part = tag_str.split("/", 1)[-1]  # image:tag or path/image:tag
-        for other in registries:
-            if other.rstrip("/") == default_repo.rstrip("/"):
-                continue
-            dest_ref = f"{other}/{image_tag_part}"
+        _, sep, rest = tag_str.partition("/")
+        image_tag_part = rest if sep else tag_str  # image:tag or path/image:tag
+        default_norm = default_repo.rstrip("/")
+        targets = [(other, f"{other}/{image_tag_part}") for other in registries if other.rstrip("/") != default_norm]
+        for _, dest_ref in targets:
             click.echo(f"Copying to {dest_ref} ...")
-            proc = subprocess.run(["crane", "copy", primary_ref, dest_ref])
+        if not targets:
+            return
+
+        # Registry-to-registry copies are independent network round-trips: run them concurrently,
+        # capturing output so it is reported per destination in order.
+        from concurrent.futures import ThreadPoolExecutor
+
+        def copy(target: tuple[str, str]) -> tuple[str, subprocess.CompletedProcess[str]]:
+            other, dest_ref = target
+            return other, subprocess.run(["crane", "copy", primary_ref, dest_ref], capture_output=True, text=True)
+
+        with ThreadPoolExecutor(max_workers=min(max_parallel_copies, len(targets))) as pool:
+            results = list(pool.map(copy, targets))
+        for other, proc in results:
+            if proc.stdout:
+                click.echo(proc.stdout, nl=False)
+            if proc.stderr:
+                click.echo(proc.stderr, nl=False, err=True)
             if proc.returncode != 0:
                 click.echo(f"::error ::crane copy to {other} failed", err=True)
                 sys.exit(proc.returncode)
@@ -561,32 +639,44 @@ def watch_deployment(
             err=True,
         )
         sys.exit(1)
-    data = read_build_result(build_result.parent if build_result.is_file() else Path.cwd())
+    # Resolved once up front: the poll loop below spawns these repeatedly
+    flux, kubectl = _require_tools("flux", "kubectl")
+    data = read_build_result(_build_result_dir(build_result))
     tag = get_first_tag(data)
     # tag may be "image-name:sha-timestamp"; full image = dest_repo/tag
     full_image = f"{dest_repo}/{tag}" if "/" not in tag else tag
-    repo_base = full_image.rsplit("/", 1)[0] if "/" in full_image else dest_repo
-    image_tag_only = tag.split(":")[-1] if ":" in tag else tag
+    head, sep, _ = full_image.rpartition("/")
+    repo_base = head if sep else dest_repo
+    image_tag_only = tag.rpartition(":")[2]  # whole tag when there is no ':'
     click.echo(f"Waiting for deployment {component_name} to use image {repo_base}/{tag} ...")
+    delay = _WATCH_POLL_INITIAL
+    last_reconcile: float | None = None
     while True:
-        subprocess.run(
-            ["flux", "reconcile", "helmrelease", component_name, "-n", namespace],
-            capture_output=True,
-        )
+        # Re-trigger Flux at most every _FLUX_RECONCILE_INTERVAL; in between, only re-check the image
+        now = time.monotonic()
+        if last_reconcile is None or now - last_reconcile >= _FLUX_RECONCILE_INTERVAL:
+            # Output is never read: let the kernel discard it instead of piping it through us
+            subprocess.run(
+                [flux, "reconcile", "helmrelease", component_name, "-n", namespace],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            last_reconcile = now
         jsonpath = "{.spec.template.spec.containers[0].image}"
         proc = subprocess.run(
-            ["kubectl", "-n", namespace, "get", "deployment", component_name, "-o", jsonpath],
+            [kubectl, "-n", namespace, "get", "deployment", component_name, "-o", jsonpath],
             capture_output=True,
             text=True,
         )
         current = (proc.stdout or "").strip()
         if current and (image_tag_only in current or tag in current):
             break
-        time.sleep(10)
+        time.sleep(delay * random.uniform(1 - _WATCH_POLL_JITTER, 1 + _WATCH_POLL_JITTER))
+        delay = min(delay * 1.5, _WATCH_POLL_MAX)
     click.echo(f"Image matched. Waiting for rollout (timeout {timeout}) ...")
     proc = subprocess.run(
         [
-            "kubectl",
+            kubectl,
             "-n",
             namespace,
             "rollout",
@@ -769,14 +859,12 @@ def promote_image(
             err=True,
         )
         sys.exit(1)
-    data = read_build_result(build_result.parent if build_result.is_file() else Path.cwd())
+    data = read_build_result(_build_result_dir(build_result))
     tag = get_first_tag(data)
     src_ref = f"{src_repo}/{tag}"
     dest_ref = f"{dest_repo}/{tag}"
     click.echo(f"Promoting {src_ref} -> {dest_ref}")
-    proc = subprocess.run(["crane", "copy", src_ref, dest_ref])
-    if proc.returncode != 0:
-        sys.exit(proc.returncode)
+    _exec_tail(["crane", "copy", src_ref, dest_ref])
 
 
 if __name__ == "__main__":
@@ -2,16 +2,35 @@
 
 from __future__ import annotations
 
+import functools
 import os
-from pathlib import Path  # noqa: TC003
+from pathlib import Path
+
+# Image repository config key per deploy environment (watch-deployment, promote-image)
+_ENV_REPOSITORY_KEYS = {
+    "dev": "GOOGLE_GKE_IMAGE_REPOSITORY",
+    "pp": "GOOGLE_GKE_IMAGE_PP_REPOSITORY",
+    "prod": "GOOGLE_GKE_IMAGE_PROD_REPOSITORY",
+}
 
 
 def load_properties_file(path: Path) -> dict[str, str]:
-    """Load key=value from a .properties-like file (skip comments and empty lines)."""
+    """Load key=value from a .properties-like file (skip comments and empty lines).
+
+    Parsed content is cached per (path, mtime, size); callers get their own copy.
+    """
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return {}
+    return dict(_load_properties_file(str(path), st.st_mtime_ns, st.st_size))
+
+
+@functools.lru_cache(maxsize=8)
+def _load_properties_file(path: str, mtime_ns: int, size: int) -> dict[str, str]:
+    """Parse the properties file at path. mtime_ns/size only key the cache."""
     result: dict[str, str] = {}
-    if not path.exists():
-        return result
-    for line in path.read_text().splitlines():
+    for line in Path(path).read_text().splitlines():
         line = line.strip()
         if not line or line.startswith("#"):
             continue
@@ -26,9 +45,8 @@ def get_config(properties_path: Path | None = None) -> dict[str, str]:
     config: dict[str, str] = {}
     if properties_path:
         config.update(load_properties_file(properties_path))
-    for key, value in os.environ.items():
-        if value is not None and value != "":
-            config[key] = value
+    # Environment values are always str; skip empty ones so they don't mask the properties file
+    config.update({key: value for key, value in os.environ.items() if value})
     return config
 
 
@@ -37,25 +55,22 @@ def get_default_repo(config: dict[str, str]) -> str | None:
     return config.get("SKAFFOLD_DEFAULT_REPO") or config.get("GOOGLE_GKE_IMAGE_REPOSITORY")
 
 
+def _env_repository_key(environment: str) -> str:
+    """Config key for environment's image repository; raise on an unknown environment."""
+    try:
+        return _ENV_REPOSITORY_KEYS[environment]
+    except KeyError:
+        raise ValueError(f"environment must be dev|pp|prod, got {environment!r}") from None
+
+
 def get_watch_destination_repository(config: dict[str, str], environment: str) -> str | None:
-    """Repository for watch-deployment by environment (dev, pp, prod)."""
-    if environment == "dev":
-        return config.get("GOOGLE_GKE_IMAGE_REPOSITORY") or config.get("WATCH_DESTINATION_REPOSITORY")
-    if environment == "pp":
-        return config.get("GOOGLE_GKE_IMAGE_PP_REPOSITORY") or config.get("WATCH_DESTINATION_REPOSITORY")
-    if environment == "prod":
-        return config.get("GOOGLE_GKE_IMAGE_PROD_REPOSITORY") or config.get("WATCH_DESTINATION_REPOSITORY")
-    return config.get("WATCH_DESTINATION_REPOSITORY")
+    """Repository for watch-deployment by environment (dev, pp, prod); other values raise ValueError."""
+    return config.get(_env_repository_key(environment)) or config.get("WATCH_DESTINATION_REPOSITORY")
 
 
 def get_promote_repositories(config: dict[str, str], source: str, destination: str) -> tuple[str | None, str | None]:
-    """(source_repo, dest_repo) for promote-image."""
-    repo_map = {
-        "dev": config.get("GOOGLE_GKE_IMAGE_REPOSITORY"),
-        "pp": config.get("GOOGLE_GKE_IMAGE_PP_REPOSITORY"),
-        "prod": config.get("GOOGLE_GKE_IMAGE_PROD_REPOSITORY"),
-    }
+    """(source_repo, dest_repo) for promote-image. source/destination must be dev, pp or prod (else ValueError)."""
     return (
-        repo_map.get(source) or config.get("PROMOTE_SOURCE_REPOSITORY"),
-        repo_map.get(destination) or config.get("PROMOTE_DESTINATION_REPOSITORY"),
+        config.get(_env_repository_key(source)) or config.get("PROMOTE_SOURCE_REPOSITORY"),
+        config.get(_env_repository_key(destination)) or config.get("PROMOTE_DESTINATION_REPOSITORY"),
     )
@@ -2,49 +2,58 @@
 
 from __future__ import annotations
 
+import os
 import re
 from pathlib import Path  # noqa: TC003
 
 _DEFAULT_CONTAINER_PORT = 8080
 _DEFAULT_ENV = {"PORT": "8080"}
 
+# Procfile web command: ${PORT:-N} (or ${PORT:- N}), then --port N / -p N
+_RE_PORT_DEFAULT = re.compile(r"\$\{PORT:-\s*(\d+)\}")
+_RE_PORT_FLAG = re.compile(r"(?:--port|-p)\s+(\d+)")
+# Dockerfile EXPOSE N; nginx.conf listen N;
+_RE_EXPOSE = re.compile(r"EXPOSE\s+(\d+)", re.IGNORECASE)
+_RE_NGINX_LISTEN = re.compile(r"listen\s+(\d+)\s*;")
+
 
 def infer_run_options(context_dir: Path) -> dict:
     """
     Infer container_port and env from context_dir (artifact's build context).
     Returns {"container_port": int, "env": dict}. Host port is not set (resolved at run time).
     """
-    context_dir = context_dir.resolve()
-    if not context_dir.is_dir():
+    # One directory listing instead of an is_dir() plus a stat per candidate file
+    try:
+        with os.scandir(context_dir) as it:
+            names = {entry.name for entry in it}
+    except OSError:
+        # Missing or not a directory
         return {
             "container_port": _DEFAULT_CONTAINER_PORT,
             "env": dict(_DEFAULT_ENV),
         }
 
     # 1) Procfile: web process, look for PORT or --port / -p
-    procfile = context_dir / "Procfile"
-    if procfile.exists():
-        port, env = _infer_from_procfile(procfile)
+    if "Procfile" in names:
+        port, env = _infer_from_procfile(context_dir / "Procfile")
         if port is not None:
             env = dict(env or {}, PORT=str(port))
             return {"container_port": port, "env": env}
         return {"container_port": _DEFAULT_CONTAINER_PORT, "env": dict(_DEFAULT_ENV)}
 
     # 2) project.toml present -> default 8080
-    if (context_dir / "project.toml").exists():
+    if "project.toml" in names:
         return {"container_port": _DEFAULT_CONTAINER_PORT, "env": dict(_DEFAULT_ENV)}
 
     # 3) Dockerfile: optional EXPOSE
-    dockerfile = context_dir / "Dockerfile"
-    if dockerfile.exists():
-        port = _infer_from_dockerfile(dockerfile)
+    if "Dockerfile" in names:
+        port = _infer_from_dockerfile(context_dir / "Dockerfile")
         env = {"PORT": str(port)}
         return {"container_port": port, "env": env}
 
     # 4) nginx.conf: listen N;
-    nginx = context_dir / "nginx.conf"
-    if nginx.exists():
-        port = _infer_from_nginx(nginx)
+    if "nginx.conf" in names:
+        port = _infer_from_nginx(context_dir / "nginx.conf")
         if port is not None:
             return {"container_port": port, "env": {"PORT": str(port)}}
 
@@ -53,52 +62,50 @@ def infer_run_options(context_dir: Path) -> dict:
 
 def _infer_from_procfile(procfile: Path) -> tuple[int | None, dict | None]:
     """Parse Procfile for web process; look for ${PORT:-N} or --port N / -p N. Returns (port, env) or (None, None)."""
-    text = procfile.read_text()
+    # One pass: stop at the web line, remembering the first process line as the fallback.
     web_line: str | None = None
-    for line in text.splitlines():
-        line = line.strip()
-        if not line or line.startswith("#"):
-            continue
-        if ":" in line:
-            name, rest = line.split(":", 1)
+    first_line: str | None = None
+    with procfile.open() as f:
+        for raw in f:
+            line = raw.strip()
+            if not line or line.startswith("#") or ":" not in line:
+                continue
+            name, _, rest = line.partition(":")
             if name.strip().lower() == "web":
                 web_line = rest.strip()
                 break
+            if first_line is None:
+                first_line = rest.strip()
     if not web_line:
         # First process line if no web
-        for line in text.splitlines():
-            line = line.strip()
-            if line and not line.startswith("#") and ":" in line:
-                _, rest = line.split(":", 1)
-                web_line = rest.strip()
-                break
+        web_line = first_line
     if not web_line:
         return None, None
 
-    # ${PORT:-N} or ${PORT:- N}
-    m = re.search(r"\$\{PORT:-\s*(\d+)\}", web_line)
+    m = _RE_PORT_DEFAULT.search(web_line)
     if m:
         return int(m.group(1)), None
-    # --port N or -p N
-    m = re.search(r"(?:--port|-p)\s+(\d+)", web_line)
+    m = _RE_PORT_FLAG.search(web_line)
     if m:
         return int(m.group(1)), None
     return None, None
 
 
 def _infer_from_dockerfile(dockerfile: Path) -> int:
-    """First EXPOSE N in Dockerfile; else default 8080."""
-    text = dockerfile.read_text()
-    m = re.search(r"EXPOSE\s+(\d+)", text, re.IGNORECASE)
-    if m:
-        return int(m.group(1))
+    """First EXPOSE N in Dockerfile; else default 8080. Reading stops at the first match."""
+    with dockerfile.open() as f:
+        for line in f:
+            m = _RE_EXPOSE.search(line)
+            if m:
+                return int(m.group(1))
     return _DEFAULT_CONTAINER_PORT
 
 
 def _infer_from_nginx(nginx_path: Path) -> int | None:
-    """listen N; in nginx.conf."""
-    text = nginx_path.read_text()
-    m = re.search(r"listen\s+(\d+)\s*;", text)
-    if m:
-        return int(m.group(1))
+    """First listen N; in nginx.conf. Reading stops at the first match."""
+    with nginx_path.open() as f:
+        for line in f:
+            m = _RE_NGINX_LISTEN.search(line)
+            if m:
+                return int(m.group(1))
     return None
@@ -2,35 +2,56 @@
 
 from __future__ import annotations
 
+import functools
 import subprocess
 import sys
-from pathlib import Path  # noqa: TC003
+from pathlib import Path
 from threading import Thread
-
-import yaml
+from typing import TYPE_CHECKING
 
 from .build_result import write_build_result
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+
+def _load_skaffold_yaml(skaffold_path: Path) -> dict:
+    """Parsed skaffold.yaml, cached per (path, mtime, size) so repeated parse_* calls read it once.
+
+    The returned dict is shared between callers and must not be mutated.
+    """
+    try:
+        st = skaffold_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Skaffold file not found: {skaffold_path}") from None
+    return _parse_skaffold_file(str(skaffold_path), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_skaffold_file(path: str, mtime_ns: int, size: int) -> dict:
+    """Parse skaffold.yaml at path. mtime_ns/size only key the cache."""
+    # Imported here so CLI commands that never read skaffold.yaml do not pay for PyYAML
+    import yaml
+
+    # libyaml-backed safe loader when PyYAML was built with it; pure-Python SafeLoader otherwise.
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(Path(path).read_bytes(), Loader=loader) or {}  # noqa: S506 - (C)SafeLoader
+
+
+def _iter_artifacts(skaffold_path: Path) -> Iterator[tuple[dict, str, str]]:
+    """Yield (artifact, image, context) for each build artifact with an image; context defaults to "."."""
+    data = _load_skaffold_yaml(skaffold_path)
+    for art in (data.get("build") or {}).get("artifacts") or []:
+        if isinstance(art, dict) and (image := art.get("image")):
+            yield art, image, art.get("context") or "."
+
 
 def parse_skaffold_artifacts(skaffold_path: Path) -> list[dict]:
     """
     Read skaffold.yaml and return all artifacts: list of {image, context}.
     context defaults to "." if not set.
     """
-    if not skaffold_path.exists():
-        raise FileNotFoundError(f"Skaffold file not found: {skaffold_path}")
-    data = yaml.safe_load(skaffold_path.read_text()) or {}
-    build = data.get("build") or {}
-    artifacts = build.get("artifacts") or []
-    result: list[dict] = []
-    for art in artifacts:
-        if not isinstance(art, dict):
-            continue
-        image = art.get("image")
-        context = art.get("context") or "."
-        if image:
-            result.append({"image": image, "context": context})
-    return result
+    return [{"image": image, "context": context} for _, image, context in _iter_artifacts(skaffold_path)]
 
 
 def parse_skaffold_buildpacks_artifacts(skaffold_path: Path) -> list[dict]:
@@ -38,22 +59,11 @@ def parse_skaffold_buildpacks_artifacts(skaffold_path: Path) -> list[dict]:
     Read skaffold.yaml and return buildpacks artifacts: list of {image, context, builder}.
     Skips artifacts that do not have buildpacks.builder.
     """
-    if not skaffold_path.exists():
-        raise FileNotFoundError(f"Skaffold file not found: {skaffold_path}")
-    data = yaml.safe_load(skaffold_path.read_text()) or {}
-    build = data.get("build") or {}
-    artifacts = build.get("artifacts") or []
     result: list[dict] = []
-    for art in artifacts:
-        if not isinstance(art, dict):
-            continue
-        buildpacks = art.get("buildpacks") or {}
+    for art, image, context in _iter_artifacts(skaffold_path):
+        buildpacks = art.get("buildpacks")
         builder = buildpacks.get("builder") if isinstance(buildpacks, dict) else None
-        if not builder:
-            continue
-        image = art.get("image")
-        context = art.get("context") or "."
-        if image:
+        if builder:
             result.append({"image": image, "context": context, "builder": builder})
     return result
 
@@ -63,26 +73,115 @@ def parse_skaffold_docker_artifacts(skaffold_path: Path) -> list[dict]:
     Read skaffold.yaml and return docker artifacts: list of {image, context, dockerfile}.
     Skips artifacts that do not have docker (e.g. buildpacks-only).
     """
-    if not skaffold_path.exists():
-        raise FileNotFoundError(f"Skaffold file not found: {skaffold_path}")
-    data = yaml.safe_load(skaffold_path.read_text()) or {}
-    build = data.get("build") or {}
-    artifacts = build.get("artifacts") or []
     result: list[dict] = []
-    for art in artifacts:
-        if not isinstance(art, dict):
-            continue
+    for art, image, context in _iter_artifacts(skaffold_path):
         docker_cfg = art.get("docker")
-        if not isinstance(docker_cfg, dict):
-            continue
-        image = art.get("image")
-        context = art.get("context") or "."
-        dockerfile = (docker_cfg.get("dockerfile") or "Dockerfile") if docker_cfg else "Dockerfile"
-        if image:
+        if isinstance(docker_cfg, dict):
+            dockerfile = docker_cfg.get("dockerfile") or "Dockerfile"
             result.append({"image": image, "context": context, "dockerfile": dockerfile})
     return result
 
 
+def _pack_build(
+    art: dict,
+    *,
+    cwd: Path,
+    tag: str,
+    pack_cmd: str,
+    full_repo: str,
+    display_repo: str,
+    insecure_registries: list[str],
+    prefix: str = "",
+) -> str:
+    """Run pack build --publish for one buildpacks artifact, streaming its output; return the pushed ref."""
+    image_name = art["image"]
+    full_image = f"{full_repo}/{image_name}:{tag}"
+    cmd = [
+        pack_cmd,
+        "build",
+        full_image,
+        "--path",
+        str(cwd / art["context"]),
+        "--builder",
+        art["builder"],
+        "--publish",
+        "--verbose",
+    ]
+    for reg in insecure_registries:
+        cmd.extend(["--insecure-registry", reg])
+    proc = subprocess.Popen(
+        cmd,
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        bufsize=1,
+    )
+    assert proc.stdout is not None and proc.stderr is not None
+
+    # Only a local registry is reached via host.docker.internal; otherwise lines pass through as-is
+    rewrite = full_repo != display_repo
+
+    def stream_fd(pipe, out_stream):
+        for line in iter(pipe.readline, ""):
+            if rewrite:
+                line = line.replace("host.docker.internal:5001", display_repo)
+            out_stream.write(prefix + line)
+            out_stream.flush()
+        pipe.close()
+
+    # One helper thread for stderr; this thread pumps stdout itself instead of idling in wait().
+    t_err = Thread(target=stream_fd, args=(proc.stderr, sys.stderr))
+    t_err.daemon = True
+    t_err.start()
+    stream_fd(proc.stdout, sys.stdout)
+    proc.wait()
+    t_err.join(timeout=5)
+    if proc.returncode != 0:
+        raise SystemExit(proc.returncode)
+    return f"{display_repo}/{image_name}:{tag}"
+
+
+def _docker_build(art: dict, *, cwd: Path, tag: str, display_repo: str) -> str:
+    """Run docker build and docker push for one docker artifact; return the pushed ref."""
+    full_image = f"{display_repo}/{art['image']}:{tag}"
+    context_dir = cwd / art["context"]
+    dockerfile_path = context_dir / art["dockerfile"]
+    if not dockerfile_path.exists():
+        sys.stderr.write(f"Dockerfile not found: {dockerfile_path}\n")
+        sys.stderr.flush()
+        raise SystemExit(1)
+    proc = subprocess.run(
+        ["docker", "build", "-t", full_image, "-f", str(dockerfile_path), str(context_dir)],
+        cwd=cwd,
+    )
+    if proc.returncode != 0:
+        raise SystemExit(proc.returncode)
+    proc = subprocess.run(["docker", "push", full_image], cwd=cwd)
+    if proc.returncode != 0:
+        raise SystemExit(proc.returncode)
+    return full_image
+
+
+def _run_concurrently(jobs: list[Callable[[], str]], max_workers: int) -> list[str]:
+    """Run jobs on up to max_workers threads; results in job order.
+
+    The first job to fail (e.g. SystemExit from a failed build) is re-raised once running
+    jobs finish; jobs not yet started are cancelled.
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    results = [""] * len(jobs)
+    pool = ThreadPoolExecutor(max_workers=min(max_workers, len(jobs)))
+    try:
+        futures = {pool.submit(job): i for i, job in enumerate(jobs)}
+        for fut in as_completed(futures):
+            results[futures[fut]] = fut.result()
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+    return results
+
+
 def run_pack_build_push(
     *,
     default_repo: str,
@@ -91,11 +190,14 @@ def run_pack_build_push(
     skaffold_path: Path | None = None,
     pack_cmd: str = "pack",
     output_dir: Path | None = None,
+    max_parallel_builds: int = 1,
 ) -> Path:
     """
     For each buildpacks artifact run pack build --publish; for each docker artifact
     run docker build and docker push. Writes build_result.json with all built images.
     Use when Skaffold fails (Mac containerd digest, Linux /layers permission denied).
+    With max_parallel_builds > 1, artifacts build concurrently (pack output lines are prefixed
+    with "[image] "); build_result.json keeps skaffold.yaml order either way.
     """
     cwd = cwd.resolve()
     skaffold_path = (skaffold_path or cwd / "skaffold.yaml").resolve()
@@ -121,74 +223,25 @@ def run_pack_build_push(
     full_repo = effective_repo.rstrip("/")
     # Result file and downstream tools use the user-facing ref (localhost:5001), not effective_repo.
     display_repo = default_repo.rstrip("/")
-    builds: list[dict] = []
-    for art in bp_artifacts:
-        image_name = art["image"]
-        context = art["context"]
-        builder = art["builder"]
-        full_image = f"{full_repo}/{image_name}:{tag}"
-        cmd = [
-            pack_cmd,
-            "build",
-            full_image,
-            "--path",
-            str(cwd / context),
-            "--builder",
-            builder,
-            "--publish",
-            "--verbose",
-        ]
-        for reg in insecure_registries:
-            cmd.extend(["--insecure-registry", reg])
-        proc = subprocess.Popen(
-            cmd,
-            cwd=cwd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            bufsize=1,
-        )
-        assert proc.stdout is not None and proc.stderr is not None
-
-        def stream_fd(pipe, out_stream):
-            for line in iter(pipe.readline, ""):
-                out_stream.write(line.replace("host.docker.internal:5001", display_repo))
-                out_stream.flush()
-            pipe.close()
-
-        t_out = Thread(target=stream_fd, args=(proc.stdout, sys.stdout))
-        t_err = Thread(target=stream_fd, args=(proc.stderr, sys.stderr))
-        t_out.daemon = True
-        t_err.daemon = True
-        t_out.start()
-        t_err.start()
-        proc.wait()
-        t_out.join(timeout=5)
-        t_err.join(timeout=5)
-        if proc.returncode != 0:
-            raise SystemExit(proc.returncode)
-        builds.append({"tag": f"{display_repo}/{image_name}:{tag}"})
-    for art in docker_artifacts:
-        image_name = art["image"]
-        context = art["context"]
-        dockerfile = art["dockerfile"]
-        full_image = f"{display_repo}/{image_name}:{tag}"
-        context_dir = cwd / context
-        dockerfile_path = context_dir / dockerfile
-        if not dockerfile_path.exists():
-            sys.stderr.write(f"Dockerfile not found: {dockerfile_path}\n")
-            sys.stderr.flush()
-            raise SystemExit(1)
-        proc = subprocess.run(
-            ["docker", "build", "-t", full_image, "-f", str(dockerfile_path), str(context_dir)],
+    parallel = max_parallel_builds > 1 and len(bp_artifacts) + len(docker_artifacts) > 1
+    jobs: list[Callable[[], str]] = [
+        functools.partial(
+            _pack_build,
+            art,
             cwd=cwd,
+            tag=tag,
+            pack_cmd=pack_cmd,
+            full_repo=full_repo,
+            display_repo=display_repo,
+            insecure_registries=insecure_registries,
+            prefix=f"[{art['image']}] " if parallel else "",
         )
-        if proc.returncode != 0:
-            raise SystemExit(proc.returncode)
-        proc = subprocess.run(["docker", "push", full_image], cwd=cwd)
-        if proc.returncode != 0:
-            raise SystemExit(proc.returncode)
-        builds.append({"tag": full_image})
+        for art in bp_artifacts
+    ]
+    jobs += [
+        functools.partial(_docker_build, art, cwd=cwd, tag=tag, display_repo=display_repo) for art in docker_artifacts
+    ]
+    tags = _run_concurrently(jobs, max_parallel_builds) if parallel else [job() for job in jobs]
     write_cwd = (output_dir or cwd).resolve()
-    out_path = write_build_result(builds, cwd=write_cwd)
+    out_path = write_build_result([{"tag": t} for t in tags], cwd=write_cwd)
     return out_path
@@ -15,6 +15,7 @@ Examples (GitHub Actions sets GITHUB_REPOSITORY_OWNER, GITHUB_REPOSITORY, etc.):
 
 from __future__ import annotations
 
+import functools
 import os
 import re
 from pathlib import Path
@@ -23,15 +24,18 @@ from typing import Any
 REGISTRY_FILENAME = ".registry"
 
 # ${VAR} or ${VAR:-default}
-_RE_INTERPOLATE = re.compile(r"\$\{([^}:]+)(?::-([^}]*))?\}|\$([A-Za-z_][A-Za-z0-9_]*)|\$\$")
+_RE_INTERPOLATE = re.compile(r"\$\{([^}:]+)(?::-([^}]*))?\}|\$([A-Za-z_][A-Za-z0-9_]*)|\$\$", re.ASCII)
 
 
 def _interpolate(s: str, env: dict[str, str] | None = None) -> str:
     """Replace ${VAR}, ${VAR:-default}, $VAR with env values; $$ → $."""
+    if "$" not in s:
+        # Plain registry URL (the common case): nothing to substitute
+        return s
     env = env if env is not None else os.environ
 
     def repl(m: re.Match[str]) -> str:
-        name, default, simple = m.group(1), m.group(2), m.group(3)
+        name, default, simple = m.groups()
         if name is not None:
             return env.get(name, default or "")
         if simple is not None:
@@ -51,6 +55,16 @@ def _normalize_entry(entry: Any, env: dict[str, str] | None = None) -> str:
     raise ValueError(f"Invalid registry entry: {entry!r}")
 
 
+@functools.lru_cache(maxsize=8)
+def _load_registry_yaml(path: str, _mtime_ns: int, _size: int) -> Any:
+    """Parse .registry YAML. Cached on (path, mtime, size); callers must not mutate the result."""
+    try:
+        import yaml
+    except ImportError:
+        raise RuntimeError("PyYAML is required to read .registry. pip install pyyaml") from None
+    return yaml.safe_load(Path(path).read_text())
+
+
 def load_registry_file(
     repo_root: Path | None = None,
     env: dict[str, str] | None = None,
@@ -64,13 +78,12 @@ def load_registry_file(
     """
     repo_root = repo_root or Path.cwd()
     path = repo_root / REGISTRY_FILENAME
-    if not path.exists():
-        return {"local": None, "ci": []}
     try:
-        import yaml
-    except ImportError:
-        raise RuntimeError("PyYAML is required to read .registry. pip install pyyaml") from None
-    raw = yaml.safe_load(path.read_text())
+        st = path.stat()
+    except FileNotFoundError:
+        return {"local": None, "ci": []}
+    # Parsed YAML is cached; interpolation below runs per call since env may differ
+    raw = _load_registry_yaml(str(path), st.st_mtime_ns, st.st_size)
     if raw is None:
         return {"local": None, "ci": []}
     if not isinstance(raw, dict):
@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
-from pathlib import Path  # noqa: TC003
+import copy
+import functools
+from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup (pip install octopilot-pipeline-tools[fast])
+    orjson = None
+
 from .infer_run_options import infer_run_options
 
 RUN_CONFIG_FILENAME = ".github/octopilot.yaml"
@@ -13,6 +20,19 @@ _DEFAULT_PORTS = ["8080:8080"]
 _DEFAULT_ENV = {"PORT": "8080"}
 
 
+_NOT_JSON = object()
+
+
+def _loads_json_subset(data: bytes) -> Any:
+    """Parse data with orjson when it is a JSON document (JSON is valid YAML); else return _NOT_JSON."""
+    if orjson is None or not data.lstrip().startswith(b"{"):
+        return _NOT_JSON
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return _NOT_JSON
+
+
 def load_run_config(cwd: Path) -> dict[str, Any]:
     """
     Load .github/octopilot.yaml from cwd. Returns a dict with:
@@ -20,15 +40,32 @@ def load_run_config(cwd: Path) -> dict[str, Any]:
       - tag: str (default "latest")
       - contexts: dict[context_name, { ports: list[str], env: dict, volumes: list[str] }]
     Missing file or empty => empty dict. Invalid YAML => raise.
+    Parsed content is cached per (path, mtime, size); callers get their own copy.
     """
     path = cwd / RUN_CONFIG_FILENAME
-    if not path.exists():
-        return {}
     try:
-        import yaml
-    except ImportError:
-        raise RuntimeError("PyYAML required to read .github/octopilot.yaml. pip install pyyaml") from None
-    raw = yaml.safe_load(path.read_text())
+        st = path.stat()
+    except FileNotFoundError:
+        return {}
+    # Copying the cached dict is still cheaper than re-parsing: ~10 us deepcopy vs ~85 us with
+    # CSafeLoader (several times more with the pure-Python loader) for a two-context config.
+    return copy.deepcopy(_load_run_config_file(str(path), st.st_mtime_ns, st.st_size))
+
+
+@functools.lru_cache(maxsize=32)
+def _load_run_config_file(path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Parse the run config at path; mtime_ns and size only key the cache so edits are picked up."""
+    data = Path(path).read_bytes()
+    raw = _loads_json_subset(data)
+    if raw is _NOT_JSON:
+        # Imported on first non-JSON parse so commands that never read this file do not pay for PyYAML
+        try:
+            import yaml
+        except ImportError:  # pragma: no cover - pyyaml is a declared dependency
+            raise RuntimeError("PyYAML required to read .github/octopilot.yaml. pip install pyyaml") from None
+        # libyaml-backed safe loader when PyYAML was built with it; pure-Python SafeLoader otherwise.
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        raw = yaml.load(data, Loader=loader)  # noqa: S506 - (C)SafeLoader
     if raw is None:
         return {}
     if not isinstance(raw, dict):
@@ -65,7 +102,7 @@ def get_run_options_for_context(
         env = {str(k): str(v) for k, v in inferred["env"].items()}
         # Octopilot overrides
         if ctx_opts.get("env") and isinstance(ctx_opts["env"], dict):
-            env.update({str(k): str(v) for k, v in ctx_opts["env"].items()})
+            env.update((str(k), str(v)) for k, v in ctx_opts["env"].items())
         octopilot_ports = ctx_opts.get("ports")
         if isinstance(octopilot_ports, list) and len(octopilot_ports) > 0:
             ports = [str(p) for p in octopilot_ports]
@@ -8,8 +8,13 @@ import socket
 def find_free_port(start: int = 8080, max_tries: int = 100) -> int:
     """
     Find an available port on 127.0.0.1 by attempting to bind.
-    Tries start, start+1, ... up to max_tries. Raises OSError if none free.
+    With start=0, the kernel picks a free ephemeral port (single bind).
+    Otherwise tries start, start+1, ... up to max_tries. Raises OSError if none free.
     """
+    if start == 0:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            s.bind(("127.0.0.1", 0))
+            return s.getsockname()[1]
     for i in range(max_tries):
         port = start + i
         try:
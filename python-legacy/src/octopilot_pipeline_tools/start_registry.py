@@ -38,11 +38,15 @@ CERT_SOURCE_PATH = "/etc/envoy/certs"
 CERT_NAMES = ("tls.crt", "tls.key")
 
 
-def _run(cmd: list[str], check: bool = True, capture: bool = False) -> subprocess.CompletedProcess:
+def _run(
+    cmd: list[str], check: bool = True, capture: bool = False, capture_stdout: bool = False
+) -> subprocess.CompletedProcess:
+    """Run cmd; capture both streams (capture) or only stdout, leaving stderr on the terminal (capture_stdout)."""
     result = subprocess.run(
         cmd,
-        capture_output=capture,
-        text=capture,
+        stdout=subprocess.PIPE if capture or capture_stdout else None,
+        stderr=subprocess.PIPE if capture else None,
+        text=capture or capture_stdout,
     )
     if check and result.returncode != 0:
         raise RuntimeError(f"Command failed: {' '.join(cmd)}")
@@ -73,46 +77,59 @@ def _replace_registry_container(
     Mounts a persistent volume for /etc/envoy/certs so the same cert is reused across restarts,
     enabling idempotent system trust (no repeated password prompts).
     """
-    for cid in _docker_ps_filter(REGISTRY_CONTAINER_NAME):
-        _run(["docker", "stop", cid], check=False)
-        _run(["docker", "rm", cid], check=False)
-
-    _run(
-        [
-            "docker",
-            "run",
-            "-d",
-            "-p",
-            port,
-            "-v",
-            volume,
-            "-v",
-            REGISTRY_CERTS_VOLUME,
-            "--restart",
-            "unless-stopped",
-            "--name",
-            REGISTRY_CONTAINER_NAME,
-            image,
-        ]
-    )
-    # Resolve ID
     ids = _docker_ps_filter(REGISTRY_CONTAINER_NAME)
-    if not ids:
+    if ids:
+        # rm -f stops and removes in one daemon call
+        _run(["docker", "rm", "-f", *ids], check=False)
+
+    cmd = [
+        "docker",
+        "run",
+        "-d",
+        "-p",
+        port,
+        "-v",
+        volume,
+        "-v",
+        REGISTRY_CERTS_VOLUME,
+        "--restart",
+        "unless-stopped",
+        "--name",
+        REGISTRY_CONTAINER_NAME,
+        image,
+    ]
+    # docker run -d prints the new container ID on stdout; stderr (pull progress) stays on the terminal
+    cid = (_run(cmd, capture_stdout=True).stdout or "").strip()
+    if not cid:
         raise RuntimeError("Container started but not found")
-    return ids[0]
+    return cid
 
 
 def _wait_for_certs(container_id: str, timeout_sec: int = 15) -> None:
-    """Wait until tls.crt exists in the container (generated at startup)."""
+    """Wait until tls.crt exists in the container (generated at startup).
+
+    The poll runs inside the container (one docker exec, 100 ms granularity). If the exec itself
+    fails (e.g. the container is still starting or has exited), retry with backoff until the deadline.
+    """
     deadline = time.monotonic() + timeout_sec
+    retry_delay = 0.5
     while time.monotonic() < deadline:
+        ticks = max(1, int((deadline - time.monotonic()) * 10))
+        script = (
+            f"i=0; while [ $i -lt {ticks} ]; do "
+            f"[ -f {CERT_SOURCE_PATH}/tls.crt ] && exit 0; sleep 0.1; i=$((i+1)); "
+            "done; exit 1"
+        )
         r = subprocess.run(
-            ["docker", "exec", container_id, "test", "-f", f"{CERT_SOURCE_PATH}/tls.crt"],
-            capture_output=True,
+            ["docker", "exec", container_id, "sh", "-c", script],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
         if r.returncode == 0:
             return
-        time.sleep(0.5)
+        # The in-container loop already polls finely; back off here so a fast-failing exec does not spin
+        time.sleep(min(retry_delay, max(0.0, deadline - time.monotonic())))
+        retry_delay = min(retry_delay * 2, 4.0)
     raise RuntimeError("Timed out waiting for certs inside container")
 
 
@@ -138,8 +155,8 @@ def is_colima_running() -> bool:
     """Return True if Colima is on PATH and its VM is running (current Docker host is Colima)."""
     r = subprocess.run(
         ["colima", "status"],
-        capture_output=True,
-        text=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
     )
     return r.returncode == 0
 
@@ -294,11 +311,11 @@ def install_cert_trust_colima(
     cert_path = cert_path.resolve()
     if not cert_path.exists():
         raise FileNotFoundError(cert_path)
-    # Check colima is available and running
+    # Check colima is available and running (only the exit status matters)
     r = subprocess.run(
         ["colima", "status"],
-        capture_output=True,
-        text=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
     )
     if r.returncode != 0:
         raise RuntimeError("Colima is not running or not on PATH. Start it with: colima start")
@@ -346,11 +363,7 @@ def start_registry(
     if certs_out_dir is None:
         certs_out_dir = Path.home() / ".config" / "registry-tls" / "certs"
 
-    _replace_registry_container(image)
-    ids = _docker_ps_filter(REGISTRY_CONTAINER_NAME)
-    if not ids:
-        raise RuntimeError("Container not found after start")
-    cid = ids[0]
+    cid = _replace_registry_container(image)
 
     _wait_for_certs(cid)
     crt_path = _copy_certs_from_container(cid, certs_out_dir)
@@ -5,14 +5,24 @@ from __future__ import annotations
 import os
 import subprocess
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
 
-def resolve_build_tag(cwd: Path | None = None) -> tuple[str | None, bool]:
+
+def resolve_build_tag(
+    cwd: Path | None = None,
+    *,
+    env: Mapping[str, str] | None = None,
+    runner: Callable[..., Any] | None = None,
+) -> tuple[str | None, bool]:
     """
     Resolve the image tag to use for this build, and whether to also tag as 'latest'.
 
     - In GitHub Actions: if GITHUB_REF is refs/tags/v* (e.g. refs/tags/v1.2.3), return
-      (version without leading 'v', True) so images get e.g. 1.2.3 and latest.
+      (version without leading 'v', True) so images get e.g. 1.2.3 and latest. Without
+      GITHUB_REF, GITHUB_REF_TYPE=tag + GITHUB_REF_NAME is used; git is never run in Actions.
     - Local/git: if HEAD has an exact tag (git describe --exact-match --tags HEAD),
       return (tag with optional 'v' stripped, True).
     - Otherwise: return (None, False) — use Skaffold default (hash) and do not add latest.
@@ -21,11 +31,18 @@ def resolve_build_tag(cwd: Path | None = None) -> tuple[str | None, bool]:
         (tag_string, add_latest): tag_string is the tag to pass to Skaffold (e.g. "1.2.3"),
         or None to use Skaffold default. add_latest is True only when we have a version tag
         (release build), so we also push the same images as :latest.
+
+    env defaults to os.environ and runner (called like subprocess.run) to subprocess.run; pass
+    them to resolve without touching the process environment or spawning git.
     """
+    if env is None:
+        env = os.environ
+    if runner is None:
+        runner = subprocess.run
     cwd = cwd or Path.cwd()
 
     # GitHub Actions: refs/tags/v1.2.3 → use 1.2.3 (or v1.2.3); add latest
-    github_ref = os.environ.get("GITHUB_REF")
+    github_ref = env.get("GITHUB_REF")
     if github_ref:
         if github_ref.startswith("refs/tags/"):
             raw = github_ref.removeprefix("refs/tags/")
@@ -34,18 +51,27 @@ def resolve_build_tag(cwd: Path | None = None) -> tuple[str | None, bool]:
                 return (tag, True)
         # GITHUB_REF set but not a tag (e.g. refs/heads/main): do not fall back to git
         return (None, False)
+    if env.get("GITHUB_ACTIONS") == "true":
+        # Actions always describes the ref via env; never spawn git in CI
+        if env.get("GITHUB_REF_TYPE") == "tag":
+            raw = env.get("GITHUB_REF_NAME") or ""
+            tag = raw[1:] if raw.startswith("v") else raw
+            if tag:
+                return (tag, True)
+        return (None, False)
 
     # Local: exact git tag on HEAD
     try:
-        proc = subprocess.run(
+        # stderr ("no tag exactly matches") is never used: discard it rather than pipe it
+        proc = runner(
             ["git", "describe", "--exact-match", "--tags", "HEAD"],
             cwd=cwd,
-            capture_output=True,
-            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             timeout=5,
         )
         if proc.returncode == 0 and proc.stdout:
-            raw = proc.stdout.strip()
+            raw = proc.stdout.decode(errors="replace").strip()
             tag = raw[1:] if raw.startswith("v") else raw
             if tag:
                 return (tag, True)
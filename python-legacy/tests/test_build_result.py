@@ -1,10 +1,15 @@
+import re
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from octopilot_pipeline_tools.build_result import (
+    _add_latest_tags,
+    _find_generic_ref,
+    _ref_to_latest_ref,
     build_result_path,
+    build_tag_index,
     find_tag_for_image,
     get_first_tag,
     parse_skaffold_output_for_tag,
@@ -12,6 +17,7 @@ from octopilot_pipeline_tools.build_result import (
     run_skaffold_build_push,
     write_build_result,
 )
+from octopilot_pipeline_tools.pack_build import parse_skaffold_artifacts
 
 
 def test_write_and_read_build_result(tmp_path: Path) -> None:
@@ -23,6 +29,19 @@ def test_write_and_read_build_result(tmp_path: Path) -> None:
     assert get_first_tag(data) == "myimage:abc1234-20250101120000"
 
 
+def test_write_and_read_build_result_stdlib_json(tmp_path: Path) -> None:
+    """Without orjson installed, build_result.json is read/written with stdlib json (same output)."""
+    builds = [{"tag": "myimage:abc1234"}]
+    with patch("octopilot_pipeline_tools.build_result.orjson", None):
+        path = write_build_result(builds, cwd=tmp_path)
+        assert read_build_result(cwd=tmp_path)["builds"] == builds
+    stdlib_bytes = path.read_bytes()
+    assert stdlib_bytes == b'{"builds":[{"tag":"myimage:abc1234"}]}'
+    # Same bytes as the orjson writer (when installed)
+    write_build_result(builds, cwd=tmp_path)
+    assert path.read_bytes() == stdlib_bytes
+
+
 def test_read_build_result_two_images(tmp_path: Path) -> None:
     """When build_result.json has two builds (e.g. frontend + api), both are returned."""
     two = (
@@ -39,11 +58,34 @@ def test_read_build_result_two_images(tmp_path: Path) -> None:
     assert "849657d" in tags[1] and "sample-static-go-api" in tags[1]
 
 
+def test_read_build_result_independent_copies_and_reloads_on_change(tmp_path: Path) -> None:
+    """Repeated reads return independent copies; rewriting the file is picked up."""
+    write_build_result([{"tag": "app:v1"}], cwd=tmp_path)
+    first = read_build_result(cwd=tmp_path)
+    first["builds"].append({"tag": "mutated:x"})
+    assert read_build_result(cwd=tmp_path) == {"builds": [{"tag": "app:v1"}]}
+    write_build_result([{"tag": "app:v22"}], cwd=tmp_path)
+    assert read_build_result(cwd=tmp_path) == {"builds": [{"tag": "app:v22"}]}
+
+
 def test_read_build_result_missing(tmp_path: Path) -> None:
     with pytest.raises(FileNotFoundError, match="not found"):
         read_build_result(cwd=tmp_path)
 
 
+def test_read_build_result_unreadable_is_not_reported_missing(tmp_path: Path) -> None:
+    write_build_result([{"tag": "app:v1"}], cwd=tmp_path)
+    with patch.object(Path, "read_bytes", side_effect=PermissionError("denied")), pytest.raises(PermissionError):
+        read_build_result(cwd=tmp_path)
+
+
+def test_parse_skaffold_artifacts_unreadable_is_not_reported_missing(tmp_path: Path) -> None:
+    skaffold = tmp_path / "skaffold.yaml"
+    skaffold.write_text("build:\n  artifacts:\n    - image: app\n")
+    with patch.object(Path, "stat", side_effect=PermissionError("denied")), pytest.raises(PermissionError):
+        parse_skaffold_artifacts(skaffold)
+
+
 def test_get_first_tag_formats() -> None:
     assert get_first_tag({"builds": [{"tag": "img:tag"}]}) == "img:tag"
     assert get_first_tag({"builds": ["img:tag"]}) == "img:tag"
@@ -61,6 +103,13 @@ def test_parse_skaffold_output_for_tag_with_pattern() -> None:
     assert builds[0]["tag"] == "myapp:abc1234-20250101120000"
 
 
+def test_parse_skaffold_output_for_tag_with_compiled_pattern() -> None:
+    out = "Tagged myapp:abc1234-20250101120000\n"
+    rx = re.compile(r"(?P<image>[a-z-]+):(?P<tag>[a-z0-9-]+)")
+    builds = parse_skaffold_output_for_tag(out, image_pattern=rx)
+    assert builds == [{"tag": "myapp:abc1234-20250101120000"}]
+
+
 def test_parse_skaffold_output_tagged_line() -> None:
     out = "Tagged buildpacksio/lifecycle as gcr.io/repo/myapp:sha123-20250101120000\n"
     builds = parse_skaffold_output_for_tag(out)
@@ -75,6 +124,23 @@ def test_parse_skaffold_output_built_line() -> None:
     assert builds[0]["tag"] == "ghcr.io/org/app:v1"
 
 
+def test_parse_skaffold_output_last_match_and_pattern_priority() -> None:
+    """The last Tagged line wins, and Tagged beats Built/generic refs that appear later."""
+    out = "Tagged a as reg.io/first:1\nTagged b as reg.io/second:2\nBuilt ctx -> reg.io/built:3\npushed other:4\n"
+    assert parse_skaffold_output_for_tag(out) == [{"tag": "reg.io/second:2"}]
+
+
+def test_parse_skaffold_output_searches_tail_then_rest() -> None:
+    """Long output is searched from its trailing lines first, falling back to the earlier part."""
+    early = "Tagged app as reg.io/app:early\n" + "noise line\n" * 50
+    with patch("octopilot_pipeline_tools.build_result._PARSE_TAIL_CHARS", 64):
+        assert parse_skaffold_output_for_tag(early) == [{"tag": "reg.io/app:early"}]
+        late = early + "Tagged app as reg.io/app:late\nnoise\n"
+        assert parse_skaffold_output_for_tag(late) == [{"tag": "reg.io/app:late"}]
+        generic = "pushed reg.io/api:v1\n" + "noise line\n" * 50
+        assert parse_skaffold_output_for_tag(generic) == [{"tag": "reg.io/api:v1"}]
+
+
 def test_parse_skaffold_output_generic_ref() -> None:
     out = "log line\nmyimage:tag123\n"
     builds = parse_skaffold_output_for_tag(out)
@@ -82,6 +148,26 @@ def test_parse_skaffold_output_generic_ref() -> None:
     assert builds[0]["tag"] == "myimage:tag123"
 
 
+def test_find_generic_ref_matches_regex_semantics() -> None:
+    """_find_generic_ref returns the same leftmost match as the regex it replaces."""
+    import re
+
+    rx = re.compile(r"[a-zA-Z0-9][a-zA-Z0-9._/-]+:[a-zA-Z0-9][a-zA-Z0-9._-]+")
+    lines = [
+        "Pushing localhost:5001/sample-api:abc123-dirty",
+        "Step 3/10 : RUN npm install",
+        "time=2024-01-01T10:00:00 level=info",
+        "(ghcr.io/org/app:v1)",
+        "a:b x:yz ab:c _.ab:cd",
+        "no colon here",
+        ":",
+        "",
+    ]
+    for line in lines:
+        m = rx.search(line)
+        assert _find_generic_ref(line) == (m.group(0) if m else None), line
+
+
 def test_parse_skaffold_output_empty_returns_empty() -> None:
     assert parse_skaffold_output_for_tag("") == []
     assert parse_skaffold_output_for_tag("no match here\n") == []
@@ -119,6 +205,23 @@ def test_find_tag_for_image() -> None:
     assert find_tag_for_image({"builds": []}, "any") is None
 
 
+def test_ref_to_latest_ref() -> None:
+    assert _ref_to_latest_ref("localhost:5001/app:abc123") == "localhost:5001/app:latest"
+    assert _ref_to_latest_ref("app") == "app:latest"
+
+
+def test_build_tag_index() -> None:
+    data = {
+        "builds": [
+            {"tag": "localhost:5001/api:1.0@sha256:abc"},
+            "ghcr.io/org/web:2.0",
+            {"tag": "localhost:5001/api:other"},
+            {"imageName": "no-tag"},
+        ]
+    }
+    assert build_tag_index(data) == {"api": "localhost:5001/api:1.0@sha256:abc", "web": "ghcr.io/org/web:2.0"}
+
+
 @patch("subprocess.run")
 def test_run_skaffold_build_push_file_output_success(mock_run: MagicMock, tmp_path: Path) -> None:
     mock_run.return_value = MagicMock(returncode=0)
@@ -136,6 +239,18 @@ def test_run_skaffold_build_push_file_output_success(mock_run: MagicMock, tmp_pa
     assert data["builds"][0]["tag"] == "app:abc123"
 
 
+@patch("subprocess.run")
+def test_run_skaffold_build_push_file_output_already_normalized_not_rewritten(
+    mock_run: MagicMock, tmp_path: Path
+) -> None:
+    """When skaffold's file is already { builds: [ { tag } ] }, it is left byte-for-byte as written."""
+    mock_run.return_value = MagicMock(returncode=0)
+    raw = '{"builds":[{"tag":"ghcr.io/org/app:abc123"}]}'
+    (tmp_path / "build_result.json").write_text(raw)
+    run_skaffold_build_push(default_repo="ghcr.io/org", cwd=tmp_path, use_file_output=True, skaffold_cmd="echo")
+    assert (tmp_path / "build_result.json").read_text() == raw
+
+
 @patch("subprocess.run")
 def test_run_skaffold_build_push_file_output_image_tag_keys(mock_run: MagicMock, tmp_path: Path) -> None:
     mock_run.return_value = MagicMock(returncode=0)
@@ -177,13 +292,16 @@ def test_run_skaffold_build_push_file_output_two_images(mock_run: MagicMock, tmp
     assert any("sample-static-go-api" in str(b.get("tag", "")) for b in data["builds"])
 
 
-@patch("subprocess.run")
-def test_run_skaffold_build_push_stdout_parse_success(mock_run: MagicMock, tmp_path: Path) -> None:
-    mock_run.return_value = MagicMock(
-        returncode=0,
-        stdout="Tagged buildpacksio/lifecycle as reg.io/app:tag1",
-        stderr="",
-    )
+def _mock_popen_output(lines: list[str], returncode: int = 0) -> MagicMock:
+    proc = MagicMock()
+    proc.stdout = iter(line.encode() + b"\n" for line in lines)
+    proc.returncode = returncode
+    return proc
+
+
+@patch("subprocess.Popen")
+def test_run_skaffold_build_push_stdout_parse_success(mock_popen: MagicMock, tmp_path: Path) -> None:
+    mock_popen.return_value = _mock_popen_output(["Tagged buildpacksio/lifecycle as reg.io/app:tag1"])
     run_skaffold_build_push(
         default_repo="reg.io",
         cwd=tmp_path,
@@ -194,9 +312,35 @@ def test_run_skaffold_build_push_stdout_parse_success(mock_run: MagicMock, tmp_p
     assert data["builds"][0]["tag"] == "reg.io/app:tag1"
 
 
-@patch("subprocess.run")
-def test_run_skaffold_build_push_stdout_parse_fails_exits(mock_run: MagicMock, tmp_path: Path) -> None:
-    mock_run.return_value = MagicMock(returncode=0, stdout="no tag here", stderr="")
+@patch("subprocess.Popen")
+def test_run_skaffold_build_push_stdout_keeps_early_pattern_matches(mock_popen: MagicMock, tmp_path: Path) -> None:
+    """Lines matching image_pattern are kept even when they scroll out of the bounded output tail."""
+    lines = ["IMAGE api TAG v1"] + [f"log line {i}" for i in range(600)] + ["IMAGE web TAG v1"]
+    mock_popen.return_value = _mock_popen_output(lines)
+    run_skaffold_build_push(
+        default_repo="reg.io",
+        cwd=tmp_path,
+        use_file_output=False,
+        skaffold_cmd="echo",
+        image_pattern=r"IMAGE (?P<image>\S+) TAG (?P<tag>\S+)",
+    )
+    data = read_build_result(cwd=tmp_path)
+    assert data["builds"] == [{"tag": "api:v1"}, {"tag": "web:v1"}]
+
+
+@patch("subprocess.Popen")
+def test_run_skaffold_build_push_stdout_invalid_utf8(mock_popen: MagicMock, tmp_path: Path) -> None:
+    """Non-UTF-8 bytes in skaffold output do not break streaming or tag parsing."""
+    proc = _mock_popen_output([])
+    proc.stdout = (line for line in [b"\xff\xfe progress\n", b"Tagged x as reg.io/app:tag1\n"])
+    mock_popen.return_value = proc
+    run_skaffold_build_push(default_repo="reg.io", cwd=tmp_path, use_file_output=False, skaffold_cmd="echo")
+    assert read_build_result(cwd=tmp_path)["builds"] == [{"tag": "reg.io/app:tag1"}]
+
+
+@patch("subprocess.Popen")
+def test_run_skaffold_build_push_stdout_parse_fails_exits(mock_popen: MagicMock, tmp_path: Path) -> None:
+    mock_popen.return_value = _mock_popen_output(["no tag here"])
     with pytest.raises(SystemExit):
         run_skaffold_build_push(
             default_repo="reg.io",
@@ -216,3 +360,17 @@ def test_run_skaffold_build_push_skaffold_fails_exits(mock_run: MagicMock, tmp_p
             use_file_output=True,
             skaffold_cmd="echo",
         )
+
+
+@patch("subprocess.run")
+def test_add_latest_tags_copies_each_image(mock_run: MagicMock, tmp_path: Path) -> None:
+    """Every tagged image gets a crane copy to :latest (copies run concurrently)."""
+    mock_run.return_value = MagicMock(returncode=0)
+    write_build_result([{"tag": "reg.io/api:1.2.3"}, {"tag": "reg.io/web:1.2.3"}, "reg.io/worker:1.2.3"], cwd=tmp_path)
+    _add_latest_tags(tmp_path)
+    copies = sorted(tuple(c[0][0]) for c in mock_run.call_args_list)
+    assert copies == [
+        ("crane", "copy", "reg.io/api:1.2.3", "reg.io/api:latest"),
+        ("crane", "copy", "reg.io/web:1.2.3", "reg.io/web:latest"),
+        ("crane", "copy", "reg.io/worker:1.2.3", "reg.io/worker:latest"),
+    ]
@@ -1,10 +1,12 @@
 import os
+import re
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
 from click.testing import CliRunner
 
-from octopilot_pipeline_tools.cli import main
+from octopilot_pipeline_tools.cli import _build_result_dir, _exec_tail, main
 from octopilot_pipeline_tools.run_config import RUN_CONFIG_FILENAME
 
 runner = CliRunner()
@@ -143,14 +145,13 @@ def test_build_push_exits_when_skaffold_yaml_missing(tmp_path: Path) -> None:
 
 
 @patch("octopilot_pipeline_tools.cli.resolve_build_tag", return_value=(None, False))
-@patch("octopilot_pipeline_tools.cli.subprocess.run")
-def test_build_invokes_skaffold(mock_run: MagicMock, _mock_resolve_tag: MagicMock) -> None:
+@patch("octopilot_pipeline_tools.cli.os.execvp")
+def test_build_invokes_skaffold(mock_exec: MagicMock, _mock_resolve_tag: MagicMock) -> None:
     """op build (no subcommand) runs full Skaffold build with cache disabled and default-repo set."""
-    mock_run.return_value = MagicMock(returncode=0)
     r = runner.invoke(main, ["build"])
     assert r.exit_code == 0
-    mock_run.assert_called_once()
-    call_args = mock_run.call_args[0][0]
+    mock_exec.assert_called_once()
+    call_args = mock_exec.call_args[0][1]
     assert "skaffold" in call_args[0]
     assert "build" in call_args
     assert "--cache-artifacts=false" in call_args
@@ -162,12 +163,11 @@ def test_build_invokes_skaffold(mock_run: MagicMock, _mock_resolve_tag: MagicMoc
 
 
 @patch("octopilot_pipeline_tools.cli.resolve_build_tag", return_value=(None, False))
-@patch("octopilot_pipeline_tools.cli.subprocess.run")
+@patch("octopilot_pipeline_tools.cli.os.execvp")
 def test_build_uses_default_repo_from_run_yaml(
-    mock_run: MagicMock, _mock_resolve_tag: MagicMock, tmp_path: Path
+    mock_exec: MagicMock, _mock_resolve_tag: MagicMock, tmp_path: Path
 ) -> None:
     """op build uses default_repo from .github/octopilot.yaml when present."""
-    mock_run.return_value = MagicMock(returncode=0)
     _write_octopilot(tmp_path, "default_repo: myreg.local:5000\n")
     old = os.getcwd()
     try:
@@ -176,19 +176,18 @@ def test_build_uses_default_repo_from_run_yaml(
     finally:
         os.chdir(old)
     assert r.exit_code == 0
-    call_args = mock_run.call_args[0][0]
+    call_args = mock_exec.call_args[0][1]
     idx = call_args.index("--default-repo")
     assert call_args[idx + 1] == "myreg.local:5000"
 
 
 @patch("octopilot_pipeline_tools.cli.resolve_build_tag", return_value=("1.2.3", False))
-@patch("octopilot_pipeline_tools.cli.subprocess.run")
-def test_build_with_version_tag_passes_tag_to_skaffold(mock_run: MagicMock, _mock_resolve_tag: MagicMock) -> None:
+@patch("octopilot_pipeline_tools.cli.os.execvp")
+def test_build_with_version_tag_passes_tag_to_skaffold(mock_exec: MagicMock, _mock_resolve_tag: MagicMock) -> None:
     """When on a version tag, op build passes --tag to Skaffold."""
-    mock_run.return_value = MagicMock(returncode=0)
     r = runner.invoke(main, ["build"])
     assert r.exit_code == 0
-    call_args = mock_run.call_args[0][0]
+    call_args = mock_exec.call_args[0][1]
     assert "--tag" in call_args
     idx = call_args.index("--tag")
     assert call_args[idx + 1] == "1.2.3"
@@ -323,10 +322,88 @@ def test_push_success(mock_build_push: MagicMock, mock_subprocess: MagicMock) ->
     assert "Wrote" in r.output
 
 
+@patch("octopilot_pipeline_tools.cli.run_skaffold_build_push")
+def test_push_compiles_image_pattern_once(mock_build_push: MagicMock) -> None:
+    """--image-pattern is compiled in push and handed on as a pattern; a bad regex fails early."""
+    mock_build_push.return_value = Path("build_result.json")
+    pattern = r"(?P<image>\S+):(?P<tag>\S+)"
+    r = runner.invoke(main, ["push", "--default-repo", "reg.io/repo", "--image-pattern", pattern])
+    assert r.exit_code == 0
+    rx = mock_build_push.call_args.kwargs["image_pattern"]
+    assert isinstance(rx, re.Pattern) and rx.pattern == pattern
+    mock_build_push.reset_mock()
+    r = runner.invoke(main, ["push", "--default-repo", "reg.io/repo", "--image-pattern", "(?P<image>"])
+    assert r.exit_code == 1
+    assert "Invalid --image-pattern" in r.output
+    mock_build_push.assert_not_called()
+
+
+@patch("octopilot_pipeline_tools.cli.subprocess.run")
+@patch("octopilot_pipeline_tools.cli.read_build_result")
+@patch("octopilot_pipeline_tools.cli.get_push_registries")
+@patch("octopilot_pipeline_tools.cli.run_skaffold_build_push")
+def test_push_all_copies_to_each_other_registry(
+    mock_build_push: MagicMock,
+    mock_registries: MagicMock,
+    mock_read_build: MagicMock,
+    mock_run: MagicMock,
+    tmp_path: Path,
+) -> None:
+    """--push-all crane copies to every CI registry except the primary; a failed copy exits non-zero."""
+    (tmp_path / ".registry").write_text("")
+    mock_build_push.return_value = tmp_path / "build_result.json"
+    mock_registries.return_value = ["reg.io/repo/", "other.io/a", "other.io/b"]
+    mock_read_build.return_value = {"builds": [{"tag": "reg.io/repo/app:v1"}]}
+    mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+    args = ["push", "--default-repo", "reg.io/repo", "--output", str(tmp_path), "--push-all"]
+    r = runner.invoke(main, args)
+    assert r.exit_code == 0
+    copies = sorted(c[0][0] for c in mock_run.call_args_list)
+    assert copies == [
+        ["crane", "copy", "reg.io/repo/app:v1", "other.io/a/repo/app:v1"],
+        ["crane", "copy", "reg.io/repo/app:v1", "other.io/b/repo/app:v1"],
+    ]
+    mock_run.return_value = MagicMock(returncode=3, stdout="", stderr="denied\n")
+    r = runner.invoke(main, args)
+    assert r.exit_code == 3
+    assert "crane copy to other.io/a failed" in r.output
+
+
+@patch("octopilot_pipeline_tools.cli.subprocess.run")
+@patch("octopilot_pipeline_tools.cli.read_build_result")
+@patch("octopilot_pipeline_tools.cli.get_push_registries")
+@patch("octopilot_pipeline_tools.cli.run_skaffold_build_push")
+def test_push_all_max_parallel_copies(
+    mock_build_push: MagicMock,
+    mock_registries: MagicMock,
+    mock_read_build: MagicMock,
+    mock_run: MagicMock,
+    tmp_path: Path,
+) -> None:
+    """--max-parallel-copies bounds the crane copy pool; it must be at least 1."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    (tmp_path / ".registry").write_text("")
+    mock_build_push.return_value = tmp_path / "build_result.json"
+    mock_registries.return_value = ["reg.io/repo", "other.io/a", "other.io/b", "other.io/c"]
+    mock_read_build.return_value = {"builds": [{"tag": "reg.io/repo/app:v1"}]}
+    mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+    args = ["push", "--default-repo", "reg.io/repo", "--output", str(tmp_path), "--push-all"]
+    with patch("concurrent.futures.ThreadPoolExecutor", wraps=ThreadPoolExecutor) as mock_pool:
+        r = runner.invoke(main, [*args, "--max-parallel-copies", "2"])
+    assert r.exit_code == 0
+    mock_pool.assert_called_once_with(max_workers=2)
+    assert mock_run.call_count == 3
+    r = runner.invoke(main, [*args, "--max-parallel-copies", "0"])
+    assert r.exit_code == 2
+
+
 @patch("octopilot_pipeline_tools.cli.get_watch_destination_repository")
 @patch("octopilot_pipeline_tools.cli.read_build_result")
 @patch("octopilot_pipeline_tools.cli.subprocess.run")
+@patch("octopilot_pipeline_tools.cli._which", side_effect=lambda name: name)
 def test_watch_deployment_success(
+    _mock_which: MagicMock,
     mock_run: MagicMock,
     mock_read_build: MagicMock,
     mock_get_dest: MagicMock,
@@ -354,28 +431,103 @@ def test_watch_deployment_success(
     assert r.exit_code == 0
 
 
-@patch("octopilot_pipeline_tools.cli.get_promote_repositories")
+@patch("octopilot_pipeline_tools.cli.time.sleep")
+@patch("octopilot_pipeline_tools.cli.get_watch_destination_repository")
 @patch("octopilot_pipeline_tools.cli.read_build_result")
 @patch("octopilot_pipeline_tools.cli.subprocess.run")
-def test_promote_image_success(
+@patch("octopilot_pipeline_tools.cli._which", side_effect=lambda name: name)
+def test_watch_deployment_polls_with_backoff(
+    _mock_which: MagicMock,
+    mock_run: MagicMock,
+    mock_read_build: MagicMock,
+    mock_get_dest: MagicMock,
+    mock_sleep: MagicMock,
+) -> None:
+    """While the deployment still has the old image, polls are spaced by a growing delay."""
+    mock_get_dest.return_value = "reg.io/repo"
+    mock_read_build.return_value = {"builds": [{"tag": "app:tag123"}]}
+    old = MagicMock(returncode=0, stdout="reg.io/repo/app:old")
+    # flux reconcile runs once: the (mocked) sleeps do not advance the clock past the reconcile interval
+    mock_run.side_effect = [
+        MagicMock(returncode=0),
+        old,
+        old,
+        MagicMock(returncode=0, stdout="reg.io/repo/app:tag123"),
+        MagicMock(returncode=0),
+    ]
+    r = runner.invoke(main, ["watch-deployment", "--component", "myapp", "--environment", "dev"])
+    assert r.exit_code == 0
+    delays = [c[0][0] for c in mock_sleep.call_args_list]
+    assert len(delays) == 2
+    assert delays[0] < delays[1]
+    # 2s then 3s, each jittered by at most 10%
+    assert 1.8 <= delays[0] <= 2.2
+    assert 2.7 <= delays[1] <= 3.3
+    assert [c[0][0][0] for c in mock_run.call_args_list] == ["flux", "kubectl", "kubectl", "kubectl", "kubectl"]
+
+
+@patch("octopilot_pipeline_tools.cli.get_watch_destination_repository")
+@patch("octopilot_pipeline_tools.cli.subprocess.run")
+@patch("octopilot_pipeline_tools.cli._which")
+def test_watch_deployment_missing_tool(
+    mock_which: MagicMock,
     mock_run: MagicMock,
+    mock_get_dest: MagicMock,
+) -> None:
+    """A tool missing from PATH is reported by name before anything is spawned."""
+    mock_get_dest.return_value = "reg.io/repo"
+    mock_which.side_effect = lambda name: None if name == "kubectl" else f"/usr/bin/{name}"
+    r = runner.invoke(main, ["watch-deployment", "--component", "myapp", "--environment", "dev"])
+    assert r.exit_code == 1
+    assert "kubectl not found on PATH" in r.output
+    mock_run.assert_not_called()
+
+
+def test_build_result_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """--build-result resolves to its parent when it is a file, else cwd; a bare name is never stat'ed."""
+    monkeypatch.chdir(tmp_path)
+    br = tmp_path / "out" / "build_result.json"
+    assert _build_result_dir(br) == tmp_path
+    br.parent.mkdir()
+    br.write_text("{}")
+    assert _build_result_dir(br) == tmp_path / "out"
+    with patch.object(Path, "is_file") as mock_is_file:
+        assert _build_result_dir(Path("build_result.json")) == tmp_path
+    mock_is_file.assert_not_called()
+
+
+@patch("octopilot_pipeline_tools.cli.get_promote_repositories")
+@patch("octopilot_pipeline_tools.cli.read_build_result")
+@patch("octopilot_pipeline_tools.cli.os.execvp")
+def test_promote_image_success(
+    mock_exec: MagicMock,
     mock_read_build: MagicMock,
     mock_get_promote: MagicMock,
 ) -> None:
     mock_get_promote.return_value = ("reg.io/dev", "reg.io/prod")
     mock_read_build.return_value = {"builds": [{"tag": "app:tag123"}]}
-    mock_run.return_value = MagicMock(returncode=0)
     r = runner.invoke(
         main,
         ["promote-image", "--source", "dev", "--destination", "prod"],
     )
     assert r.exit_code == 0
-    mock_run.assert_called_once()
-    call_args = mock_run.call_args[0][0]
+    mock_exec.assert_called_once()
+    call_args = mock_exec.call_args[0][1]
     assert "crane" in call_args
     assert "copy" in call_args
 
 
+@patch("octopilot_pipeline_tools.cli.subprocess.run")
+@patch("octopilot_pipeline_tools.cli.os.name", "nt")
+def test_exec_tail_runs_and_exits_on_windows(mock_run: MagicMock) -> None:
+    """Without a real exec on Windows, the final command runs as a child and its status is ours."""
+    mock_run.return_value = MagicMock(returncode=3)
+    with pytest.raises(SystemExit) as exc:
+        _exec_tail(["crane", "copy", "a", "b"])
+    assert exc.value.code == 3
+    mock_run.assert_called_once_with(["crane", "copy", "a", "b"])
+
+
 def test_run_help() -> None:
     r = runner.invoke(main, ["run"])
     assert r.exit_code == 0
@@ -403,9 +555,38 @@ build:
     assert "api" in r.output and "frontend" in r.output
 
 
-@patch("octopilot_pipeline_tools.cli.subprocess.run")
-def test_run_context_invokes_docker(mock_run: MagicMock, tmp_path: Path) -> None:
-    mock_run.return_value = MagicMock(returncode=0)
+@patch("octopilot_pipeline_tools.cli._run_resolve_default_repo")
+@patch("octopilot_pipeline_tools.cli.load_run_config")
+def test_run_context_list_skips_run_config(
+    mock_load_run_config: MagicMock, mock_resolve_repo: MagicMock, tmp_path: Path
+) -> None:
+    """op run context list only needs skaffold.yaml: no octopilot.yaml read or registry lookup."""
+    skaffold = tmp_path / "skaffold.yaml"
+    skaffold.write_text("build:\n  artifacts:\n    - image: app-api\n      context: api\n")
+    r = runner.invoke(
+        main,
+        ["run", "context", "list", "--skaffold-file", str(skaffold)],
+        obj={"config": {}},
+    )
+    assert r.exit_code == 0
+    assert "api" in r.output
+    mock_load_run_config.assert_not_called()
+    mock_resolve_repo.assert_not_called()
+
+
+def test_run_context_list_skaffold_missing(tmp_path: Path) -> None:
+    """op run context list reports a missing skaffold file without a separate exists() check."""
+    r = runner.invoke(
+        main,
+        ["run", "context", "list", "--skaffold-file", str(tmp_path / "nope.yaml")],
+        obj={"config": {}},
+    )
+    assert r.exit_code == 1
+    assert "Skaffold file not found" in r.output
+
+
+@patch("octopilot_pipeline_tools.cli.os.execvp")
+def test_run_context_invokes_docker(mock_exec: MagicMock, tmp_path: Path) -> None:
     skaffold = tmp_path / "skaffold.yaml"
     skaffold.write_text("""
 apiVersion: skaffold/v2beta29
@@ -421,8 +602,8 @@ build:
         obj={"config": {}},
     )
     assert r.exit_code == 0
-    mock_run.assert_called_once()
-    call_args = mock_run.call_args[0][0]
+    mock_exec.assert_called_once()
+    call_args = mock_exec.call_args[0][1]
     assert call_args[0] == "docker"
     assert "run" in call_args
     assert "localhost:5001/myapp-api:latest" in call_args
@@ -430,9 +611,8 @@ build:
     assert "-e" in call_args
 
 
-@patch("octopilot_pipeline_tools.cli.subprocess.run")
-def test_run_uses_build_result_when_present(mock_run: MagicMock, tmp_path: Path) -> None:
-    mock_run.return_value = MagicMock(returncode=0)
+@patch("octopilot_pipeline_tools.cli.os.execvp")
+def test_run_uses_build_result_when_present(mock_exec: MagicMock, tmp_path: Path) -> None:
     skaffold = tmp_path / "skaffold.yaml"
     skaffold.write_text("""
 apiVersion: skaffold/v2beta29
@@ -455,7 +635,7 @@ build:
     finally:
         os.chdir(old_cwd)
     assert r.exit_code == 0
-    call_args = mock_run.call_args[0][0]
+    call_args = mock_exec.call_args[0][1]
     assert "localhost:5001/myapp-api:latest" in call_args
     # Octopilot ports override: must see -p 8080:8080
     idx = call_args.index("-p")
@@ -463,10 +643,9 @@ build:
     assert call_args[idx + 1] == "8080:8080"
 
 
-@patch("octopilot_pipeline_tools.cli.subprocess.run")
-def test_run_explicit_octopilot_ports_used_as_is(mock_run: MagicMock, tmp_path: Path) -> None:
+@patch("octopilot_pipeline_tools.cli.os.execvp")
+def test_run_explicit_octopilot_ports_used_as_is(mock_exec: MagicMock, tmp_path: Path) -> None:
     """When octopilot sets ports for context, op run uses them (no free-port scan)."""
-    mock_run.return_value = MagicMock(returncode=0)
     skaffold = tmp_path / "skaffold.yaml"
     skaffold.write_text("""
 apiVersion: skaffold/v2beta29
@@ -489,7 +668,7 @@ build:
     finally:
         os.chdir(old_cwd)
     assert r.exit_code == 0
-    call_args = mock_run.call_args[0][0]
+    call_args = mock_exec.call_args[0][1]
     idx = call_args.index("-p")
     assert call_args[idx + 1] == "3001:8080"
 
@@ -1,5 +1,8 @@
 import os
 from pathlib import Path
+from unittest.mock import patch
+
+import pytest
 
 from octopilot_pipeline_tools.config import (
     get_config,
@@ -14,12 +17,30 @@ def test_load_properties_file_empty(tmp_path: Path) -> None:
     assert load_properties_file(tmp_path / "missing") == {}
 
 
+def test_load_properties_file_unreadable_raises(tmp_path: Path) -> None:
+    p = tmp_path / "pipeline.properties"
+    p.write_text("A=1\n")
+    with patch.object(Path, "stat", side_effect=PermissionError("denied")), pytest.raises(PermissionError):
+        load_properties_file(p)
+
+
 def test_load_properties_file(tmp_path: Path) -> None:
     p = tmp_path / "p.properties"
     p.write_text("# comment\nKEY1=value1\n\nKEY2=value2\n")
     assert load_properties_file(p) == {"KEY1": "value1", "KEY2": "value2"}
 
 
+def test_load_properties_file_cached_copy_and_reloads_on_change(tmp_path: Path) -> None:
+    """Repeated loads return independent copies; editing the file is picked up."""
+    p = tmp_path / "p.properties"
+    p.write_text("KEY=one\n")
+    first = load_properties_file(p)
+    first["KEY"] = "mutated"
+    assert load_properties_file(p) == {"KEY": "one"}
+    p.write_text("KEY=three\n")
+    assert load_properties_file(p) == {"KEY": "three"}
+
+
 def test_get_config_env_overrides_properties(tmp_path: Path) -> None:
     (tmp_path / "p.properties").write_text("FOO=from_file\n")
     os.environ["FOO"] = "from_env"
@@ -30,6 +51,15 @@ def test_get_config_env_overrides_properties(tmp_path: Path) -> None:
         os.environ.pop("FOO", None)
 
 
+def test_get_config_empty_env_does_not_mask_properties(tmp_path: Path) -> None:
+    (tmp_path / "p.properties").write_text("FOO=from_file\n")
+    os.environ["FOO"] = ""
+    try:
+        assert get_config(tmp_path / "p.properties")["FOO"] == "from_file"
+    finally:
+        os.environ.pop("FOO", None)
+
+
 def test_get_default_repo() -> None:
     assert get_default_repo({}) is None
     assert get_default_repo({"SKAFFOLD_DEFAULT_REPO": "localhost:5001"}) == "localhost:5001"
@@ -49,8 +79,9 @@ def test_get_watch_destination_repository() -> None:
 
 
 def test_get_watch_destination_repository_fallback_and_unknown_env() -> None:
-    # Unknown environment returns WATCH_DESTINATION_REPOSITORY
-    assert get_watch_destination_repository({"WATCH_DESTINATION_REPOSITORY": "custom"}, "staging") == "custom"
+    # Unknown environment is rejected instead of silently using WATCH_DESTINATION_REPOSITORY
+    with pytest.raises(ValueError, match="staging"):
+        get_watch_destination_repository({"WATCH_DESTINATION_REPOSITORY": "custom"}, "staging")
     # dev falls back to WATCH_DESTINATION_REPOSITORY if GOOGLE_GKE_* not set
     assert get_watch_destination_repository({"WATCH_DESTINATION_REPOSITORY": "fallback"}, "dev") == "fallback"
 
@@ -69,3 +100,5 @@ def test_get_promote_repositories() -> None:
     src2, dest2 = get_promote_repositories(config2, "dev", "pp")
     assert src2 == "src.io"
     assert dest2 == "dest.io"
+    with pytest.raises(ValueError, match="qa"):
+        get_promote_repositories(config2, "dev", "qa")
@@ -12,6 +12,11 @@ def test_infer_run_options_no_dir_returns_defaults(tmp_path: Path) -> None:
     assert opts["env"]["PORT"] == "8080"
 
 
+def test_infer_run_options_file_instead_of_dir_returns_defaults(tmp_path: Path) -> None:
+    (tmp_path / "app").write_text("not a directory\n")
+    assert infer_run_options(tmp_path / "app") == {"container_port": 8080, "env": {"PORT": "8080"}}
+
+
 def test_infer_run_options_procfile_port_syntax(tmp_path: Path) -> None:
     (tmp_path / "Procfile").write_text("web: node server.js --port ${PORT:-3000}\n")
     opts = infer_run_options(tmp_path)
@@ -26,6 +31,11 @@ def test_infer_run_options_procfile_web_first(tmp_path: Path) -> None:
     assert opts["env"]["PORT"] == "8080"
 
 
+def test_infer_run_options_procfile_falls_back_to_first_process(tmp_path: Path) -> None:
+    (tmp_path / "Procfile").write_text("# comment\napi: gunicorn -p 5000 app\nworker: celery -p 6000\n")
+    assert infer_run_options(tmp_path)["container_port"] == 5000
+
+
 def test_infer_run_options_project_toml_default(tmp_path: Path) -> None:
     (tmp_path / "project.toml").write_text('[project]\nname = "app"\n')
     opts = infer_run_options(tmp_path)
@@ -40,6 +50,11 @@ def test_infer_run_options_dockerfile_expose(tmp_path: Path) -> None:
     assert opts["env"]["PORT"] == "9000"
 
 
+def test_infer_run_options_dockerfile_first_expose_wins(tmp_path: Path) -> None:
+    (tmp_path / "Dockerfile").write_text("FROM node:20 AS build\nRUN make\nEXPOSE 4000\nFROM nginx\nEXPOSE 9000\n")
+    assert infer_run_options(tmp_path)["container_port"] == 4000
+
+
 def test_infer_run_options_dockerfile_no_expose_default(tmp_path: Path) -> None:
     (tmp_path / "Dockerfile").write_text('FROM node:20\nCOPY . .\nCMD ["node", "app"]\n')
     opts = infer_run_options(tmp_path)
@@ -4,6 +4,7 @@ from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
+import yaml
 
 from octopilot_pipeline_tools.pack_build import (
     parse_skaffold_artifacts,
@@ -34,6 +35,20 @@ build:
     assert artifacts[2]["context"] == "."
 
 
+def test_parse_skaffold_yaml_parsed_once_and_reloaded_on_change(tmp_path: Path) -> None:
+    """All parse_skaffold_* calls share one parse per file version; editing the file is picked up."""
+    skaffold = tmp_path / "skaffold.yaml"
+    skaffold.write_text("build:\n  artifacts:\n    - image: app\n      docker: {}\n")
+    with patch("yaml.load", wraps=yaml.load) as mock_load:
+        assert parse_skaffold_artifacts(skaffold) == [{"image": "app", "context": "."}]
+        assert parse_skaffold_docker_artifacts(skaffold)[0]["image"] == "app"
+        assert parse_skaffold_buildpacks_artifacts(skaffold) == []
+        assert mock_load.call_count == 1
+        skaffold.write_text("build:\n  artifacts:\n    - image: other-app\n")
+        assert parse_skaffold_artifacts(skaffold) == [{"image": "other-app", "context": "."}]
+        assert mock_load.call_count == 2
+
+
 def test_parse_skaffold_buildpacks_artifacts(tmp_path: Path) -> None:
     skaffold = tmp_path / "skaffold.yaml"
     skaffold.write_text("""
@@ -252,3 +267,102 @@ def test_run_pack_build_push_no_artifacts_exits(mock_popen: MagicMock, tmp_path:
             skaffold_path=skaffold,
         )
     mock_popen.assert_not_called()
+
+
+_TWO_BUILDPACKS_ARTIFACTS = """
+apiVersion: skaffold/v2beta29
+kind: Config
+build:
+  artifacts:
+    - image: api
+      context: api
+      buildpacks:
+        builder: paketobuildpacks/builder-jammy-base
+    - image: worker
+      context: worker
+      buildpacks:
+        builder: paketobuildpacks/builder-jammy-base
+"""
+
+
+@patch("octopilot_pipeline_tools.pack_build.subprocess.Popen")
+def test_run_pack_build_push_parallel_keeps_artifact_order(
+    mock_popen: MagicMock, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """With max_parallel_builds > 1, output lines carry the image name and results keep skaffold.yaml order."""
+
+    def popen(cmd, **_kwargs):
+        proc = _mock_popen_success()
+        proc.stdout.readline.side_effect = [f"building {cmd[2]}\n", ""]
+        return proc
+
+    mock_popen.side_effect = popen
+    skaffold = tmp_path / "skaffold.yaml"
+    skaffold.write_text(_TWO_BUILDPACKS_ARTIFACTS)
+    out = run_pack_build_push(
+        default_repo="ghcr.io/org",
+        cwd=tmp_path,
+        skaffold_path=skaffold,
+        max_parallel_builds=2,
+    )
+    data = __import__("json").loads(out.read_text())
+    assert data["builds"] == [{"tag": "ghcr.io/org/api:latest"}, {"tag": "ghcr.io/org/worker:latest"}]
+    printed = capsys.readouterr().out
+    assert "[api] building ghcr.io/org/api:latest" in printed
+    assert "[worker] building ghcr.io/org/worker:latest" in printed
+
+
+@patch("octopilot_pipeline_tools.pack_build.subprocess.Popen")
+def test_run_pack_build_push_parallel_failure_exits(mock_popen: MagicMock, tmp_path: Path) -> None:
+    """A failed build in parallel mode exits with its return code and writes no build_result.json."""
+    mock_popen.side_effect = lambda cmd, **_kwargs: _mock_popen_success(returncode=5 if "worker" in cmd[2] else 0)
+    skaffold = tmp_path / "skaffold.yaml"
+    skaffold.write_text(_TWO_BUILDPACKS_ARTIFACTS)
+    with pytest.raises(SystemExit) as exc:
+        run_pack_build_push(
+            default_repo="ghcr.io/org",
+            cwd=tmp_path,
+            skaffold_path=skaffold,
+            max_parallel_builds=2,
+        )
+    assert exc.value.code == 5
+    assert not (tmp_path / "build_result.json").exists()
+
+
+@patch("octopilot_pipeline_tools.pack_build.subprocess.Popen")
+def test_run_pack_build_push_streams_with_one_helper_thread(
+    mock_popen: MagicMock, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """stdout is pumped by the calling thread; only stderr gets a helper thread."""
+    from threading import Thread
+
+    proc = _mock_popen_success()
+    proc.stdout.readline.side_effect = ["out host.docker.internal:5001/app\n", ""]
+    proc.stderr.readline.side_effect = ["err line\n", ""]
+    mock_popen.return_value = proc
+    skaffold = tmp_path / "skaffold.yaml"
+    skaffold.write_text(
+        "build:\n  artifacts:\n    - image: app\n      context: .\n      buildpacks:\n        builder: b\n"
+    )
+    with patch("octopilot_pipeline_tools.pack_build.Thread", wraps=Thread) as mock_thread:
+        run_pack_build_push(default_repo="localhost:5001", cwd=tmp_path, skaffold_path=skaffold)
+    assert mock_thread.call_count == 1
+    captured = capsys.readouterr()
+    assert "out localhost:5001/app" in captured.out
+    assert "err line" in captured.err
+
+
+@patch("octopilot_pipeline_tools.pack_build.subprocess.Popen")
+def test_run_pack_build_push_remote_repo_output_passes_through(
+    mock_popen: MagicMock, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Output is only rewritten for the local registry; with a remote repo lines are echoed unchanged."""
+    proc = _mock_popen_success()
+    proc.stdout.readline.side_effect = ["pinging host.docker.internal:5001\n", ""]
+    mock_popen.return_value = proc
+    skaffold = tmp_path / "skaffold.yaml"
+    skaffold.write_text(
+        "build:\n  artifacts:\n    - image: app\n      context: .\n      buildpacks:\n        builder: b\n"
+    )
+    run_pack_build_push(default_repo="ghcr.io/org", cwd=tmp_path, skaffold_path=skaffold)
+    assert "pinging host.docker.internal:5001\n" in capsys.readouterr().out
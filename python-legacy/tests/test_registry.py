@@ -1,6 +1,8 @@
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
+import yaml
 
 from octopilot_pipeline_tools.registry import (
     REGISTRY_FILENAME,
@@ -14,6 +16,12 @@ def test_load_registry_file_missing(tmp_path: Path) -> None:
     assert load_registry_file(tmp_path) == {"local": None, "ci": []}
 
 
+def test_load_registry_file_unreadable_raises(tmp_path: Path) -> None:
+    (tmp_path / REGISTRY_FILENAME).write_text("local: reg.local:5001\n")
+    with patch.object(Path, "stat", side_effect=PermissionError("denied")), pytest.raises(PermissionError):
+        load_registry_file(tmp_path)
+
+
 def test_load_registry_file_empty(tmp_path: Path) -> None:
     (tmp_path / REGISTRY_FILENAME).write_text("")
     # empty YAML -> None
@@ -35,6 +43,22 @@ def test_load_registry_file_ci_with_url_objects(tmp_path: Path) -> None:
     assert data["ci"] == ["ghcr.io/octopilot", "docker.io/user"]
 
 
+def test_load_registry_file_parses_once_and_reloads_on_change(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """The YAML is parsed once per file version; env interpolation still runs on every call."""
+    reg = tmp_path / REGISTRY_FILENAME
+    reg.write_text("local: localhost:5001\nci:\n  - ghcr.io/${OWNER}\n")
+    with patch("yaml.safe_load", wraps=yaml.safe_load) as mock_load:
+        monkeypatch.setenv("OWNER", "a")
+        assert load_registry_file(tmp_path)["ci"] == ["ghcr.io/a"]
+        monkeypatch.setenv("OWNER", "b")
+        assert load_registry_file(tmp_path)["ci"] == ["ghcr.io/b"]
+        assert get_default_repo_from_registry(tmp_path, destination="local") == "localhost:5001"
+        assert mock_load.call_count == 1
+        reg.write_text("local: localhost:5002\n")
+        assert load_registry_file(tmp_path)["local"] == "localhost:5002"
+        assert mock_load.call_count == 2
+
+
 def test_get_push_registries_auto_local(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     (tmp_path / REGISTRY_FILENAME).write_text("local: localhost:5001\nci:\n  - ghcr.io/org\n")
     monkeypatch.delenv("GITHUB_ACTIONS", raising=False)
@@ -83,6 +107,14 @@ def test_registry_interpolation_dollar_dollar(tmp_path: Path) -> None:
     assert data["local"] == "prefix$suffix"
 
 
+def test_registry_interpolation_skips_regex_without_dollar(tmp_path: Path) -> None:
+    (tmp_path / REGISTRY_FILENAME).write_text("local: localhost:5001\nci:\n  - ghcr.io/org\n")
+    with patch("octopilot_pipeline_tools.registry._RE_INTERPOLATE") as mock_re:
+        data = load_registry_file(tmp_path)
+    assert data == {"local": "localhost:5001", "ci": ["ghcr.io/org"]}
+    mock_re.sub.assert_not_called()
+
+
 def test_load_registry_file_invalid_not_dict(tmp_path: Path) -> None:
     (tmp_path / REGISTRY_FILENAME).write_text("local: localhost\n")  # YAML list or scalar
     (tmp_path / REGISTRY_FILENAME).write_text('["list"]')
@@ -1,6 +1,12 @@
 """Tests for run_config module (.github/octopilot.yaml loading)."""
 
+import os
+import subprocess
+import sys
 from pathlib import Path
+from unittest.mock import patch
+
+import pytest
 
 from octopilot_pipeline_tools.run_config import (
     RUN_CONFIG_FILENAME,
@@ -47,6 +53,33 @@ contexts:
     assert cfg["contexts"]["api"]["ports"] == ["8081:8080"]
 
 
+def test_load_run_config_cached_copy_and_reloads_on_change(tmp_path: Path) -> None:
+    """Repeated loads return independent copies; editing the file is picked up."""
+    p = _octopilot_path(tmp_path)
+    p.write_text("default_repo: a.io\n")
+    first = load_run_config(tmp_path)
+    first["default_repo"] = "mutated"
+    assert load_run_config(tmp_path) == {"default_repo": "a.io"}
+    p.write_text("default_repo: bb.io\n")
+    assert load_run_config(tmp_path) == {"default_repo": "bb.io"}
+
+
+def test_load_run_config_unreadable_raises(tmp_path: Path) -> None:
+    """Only a missing file means "no run config"; other stat errors propagate."""
+    _octopilot_path(tmp_path).write_text("default_repo: a.io\n")
+    with patch.object(Path, "stat", side_effect=PermissionError("denied")), pytest.raises(PermissionError):
+        load_run_config(tmp_path)
+
+
+def test_load_run_config_json_and_flow_yaml(tmp_path: Path) -> None:
+    """JSON content takes the JSON fast path; YAML flow mappings that are not JSON still parse."""
+    p = _octopilot_path(tmp_path)
+    p.write_text('{"default_repo": "ghcr.io/org", "contexts": {"api": {"ports": ["8081:8080"]}}}')
+    assert load_run_config(tmp_path) == {"default_repo": "ghcr.io/org", "contexts": {"api": {"ports": ["8081:8080"]}}}
+    p.write_text("{default_repo: ghcr.io/other, tag: v1}\n")
+    assert load_run_config(tmp_path) == {"default_repo": "ghcr.io/other", "tag": "v1"}
+
+
 def test_get_run_options_for_context_from_file(tmp_path: Path) -> None:
     _octopilot_path(tmp_path).write_text("""
 contexts:
@@ -107,3 +140,10 @@ def test_get_default_repo_and_tag_for_run(tmp_path: Path) -> None:
     repo, tag = get_default_repo_and_tag_for_run(tmp_path)
     assert repo == "ghcr.io/org"
     assert tag == "v1"
+
+
+def test_importing_cli_does_not_load_yaml() -> None:
+    """PyYAML is imported on first YAML parse, not when the CLI modules load."""
+    code = "import sys, octopilot_pipeline_tools.cli; sys.exit('yaml' in sys.modules)"
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    assert subprocess.run([sys.executable, "-c", code], env=env).returncode == 0
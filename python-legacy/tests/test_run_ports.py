@@ -36,3 +36,13 @@ def test_find_free_port_raises_when_all_busy() -> None:
     finally:
         for s in sockets:
             s.close()
+
+
+def test_find_free_port_start_zero_uses_ephemeral_port() -> None:
+    """start=0 lets the kernel pick a free port."""
+    import socket
+
+    port = find_free_port(start=0)
+    assert port > 0
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", port))
@@ -1,5 +1,6 @@
 """Tests for start_registry module."""
 
+import subprocess
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -8,6 +9,8 @@ import pytest
 from octopilot_pipeline_tools.start_registry import (
     _cert_fingerprint_sha1,
     _docker_ps_filter,
+    _replace_registry_container,
+    _wait_for_certs,
     etc_hosts_has_registry_local,
     install_cert_trust,
     install_cert_trust_colima,
@@ -30,11 +33,62 @@ def test_docker_ps_filter_one_id(mock_run: MagicMock) -> None:
     assert _docker_ps_filter("registry") == ["abc123"]
 
 
+@patch("octopilot_pipeline_tools.start_registry.subprocess.run")
+def test_replace_registry_container_returns_run_id(mock_run: MagicMock) -> None:
+    mock_run.side_effect = [
+        MagicMock(stdout="", returncode=0),
+        MagicMock(stdout="newcid\n", returncode=0),
+    ]
+    assert _replace_registry_container("myreg:latest") == "newcid"
+    assert mock_run.call_count == 2
+    assert mock_run.call_args.args[0][:3] == ["docker", "run", "-d"]
+    # Only stdout is captured, so pull progress on stderr still reaches the terminal
+    assert mock_run.call_args.kwargs["stdout"] == subprocess.PIPE
+    assert mock_run.call_args.kwargs["stderr"] is None
+
+
+@patch("octopilot_pipeline_tools.start_registry.subprocess.run")
+def test_replace_registry_container_run_failure(mock_run: MagicMock) -> None:
+    mock_run.side_effect = [MagicMock(stdout="", returncode=0), MagicMock(stdout="", returncode=125)]
+    with pytest.raises(RuntimeError, match="Command failed: docker run"):
+        _replace_registry_container("myreg:latest")
+
+
+@patch("octopilot_pipeline_tools.start_registry.subprocess.run")
+def test_replace_registry_container_removes_existing_in_one_call(mock_run: MagicMock) -> None:
+    mock_run.side_effect = [
+        MagicMock(stdout="old1\nold2\n", returncode=0),
+        MagicMock(returncode=0),
+        MagicMock(stdout="newcid\n", returncode=0),
+    ]
+    assert _replace_registry_container("myreg:latest") == "newcid"
+    assert mock_run.call_args_list[1].args[0] == ["docker", "rm", "-f", "old1", "old2"]
+
+
+@patch("octopilot_pipeline_tools.start_registry.subprocess.run")
+def test_wait_for_certs_polls_inside_container(mock_run: MagicMock) -> None:
+    mock_run.return_value = MagicMock(returncode=0)
+    _wait_for_certs("cid123")
+    mock_run.assert_called_once()
+    cmd = mock_run.call_args.args[0]
+    assert cmd[:5] == ["docker", "exec", "cid123", "sh", "-c"]
+    assert "/etc/envoy/certs/tls.crt" in cmd[5]
+
+
+@patch("octopilot_pipeline_tools.start_registry.time.sleep")
+@patch("octopilot_pipeline_tools.start_registry.subprocess.run")
+def test_wait_for_certs_retries_failed_exec(mock_run: MagicMock, mock_sleep: MagicMock) -> None:
+    mock_run.side_effect = [MagicMock(returncode=126), MagicMock(returncode=126), MagicMock(returncode=0)]
+    _wait_for_certs("cid123")
+    assert mock_run.call_count == 3
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [0.5, 1.0]
+
+
 @patch("octopilot_pipeline_tools.start_registry.subprocess.run")
 def test_is_colima_running_true(mock_run: MagicMock) -> None:
     mock_run.return_value = MagicMock(returncode=0)
     assert is_colima_running() is True
-    mock_run.assert_called_once_with(["colima", "status"], capture_output=True, text=True)
+    mock_run.assert_called_once_with(["colima", "status"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
 
 @patch("octopilot_pipeline_tools.start_registry.subprocess.run")
@@ -188,6 +242,7 @@ def test_start_registry_copies_certs(
     mock_replace.assert_called_once_with("myreg:latest")
     mock_wait.assert_called_once_with("cid123")
     mock_copy.assert_called_once_with("cid123", tmp_path)
+    mock_ps.assert_not_called()
     assert result == tmp_path / "tls.crt"
 
 
@@ -0,0 +1,60 @@
+"""Tests for scripts/strip_cursor_coauthor.py: the sh/awk hook must match the Python hook."""
+
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).resolve().parents[2] / "scripts" / "strip_cursor_coauthor.py"
+
+pytestmark = pytest.mark.skipif(
+    not SCRIPT.exists() or shutil.which("sh") is None or shutil.which("awk") is None,
+    reason="needs the repo's scripts/ directory, sh and awk",
+)
+
+FIXTURES = [
+    # git's editor template: the empty first line must survive
+    "\n# Please enter the commit message for your changes.\n#\n",
+    "Fix parser\n\nCo-authored-by: Cursor <cursoragent@cursor.com>\n",
+    "Fix parser\n\nBody text\n\n\n\nCo-Authored-By:  cursor <CursorAgent@cursor.com>  \n\n",
+    "\n\n\nLeading blanks\n",
+    "Subject\n\nSigned-off-by: Dev <dev@example.com>\nCo-authored-by: Cursor <cursoragent@cursor.com>\n",
+    "Trailing spaces   \n   \n\t\n",
+    "Co-authored-by: Cursor <cursoragent@cursor.com>\n",
+]
+
+
+def _write_sh_hook(tmp_path: Path) -> Path:
+    out = subprocess.run([sys.executable, str(SCRIPT), "--print-sh-hook"], check=True, capture_output=True, text=True)
+    hook = tmp_path / "prepare-commit-msg"
+    hook.write_text(out.stdout)
+    return hook
+
+
+def _run_python_hook(path: Path) -> str:
+    subprocess.run([sys.executable, str(SCRIPT), str(path)], check=True)
+    return path.read_text()
+
+
+def _run_sh_hook(path: Path, hook: Path) -> str:
+    subprocess.run(["sh", str(hook), str(path)], check=True)
+    return path.read_text()
+
+
+@pytest.mark.parametrize("text", FIXTURES)
+def test_sh_hook_matches_python_hook(text: str, tmp_path: Path) -> None:
+    hook = _write_sh_hook(tmp_path)
+    py_msg = tmp_path / "py_msg"
+    sh_msg = tmp_path / "sh_msg"
+    py_msg.write_text(text)
+    sh_msg.write_text(text)
+    assert _run_sh_hook(sh_msg, hook) == _run_python_hook(py_msg)
+
+
+def test_sh_hook_keeps_editor_template_first_line(tmp_path: Path) -> None:
+    hook = _write_sh_hook(tmp_path)
+    msg = tmp_path / "COMMIT_EDITMSG"
+    msg.write_text(FIXTURES[0])
+    assert _run_sh_hook(msg, hook) == FIXTURES[0]
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+import subprocess
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -33,13 +34,26 @@ def test_resolve_build_tag_github_ref_not_tag() -> None:
     assert add_latest is False
 
 
+def test_resolve_build_tag_github_actions_uses_ref_name_without_git() -> None:
+    """In GitHub Actions without GITHUB_REF, GITHUB_REF_TYPE/NAME decide and git is not run."""
+    env = {"GITHUB_ACTIONS": "true", "GITHUB_REF_TYPE": "tag", "GITHUB_REF_NAME": "v3.1.0"}
+    with (
+        patch.dict(os.environ, env, clear=True),
+        patch("octopilot_pipeline_tools.tag_resolution.subprocess.run") as mock_run,
+    ):
+        assert resolve_build_tag() == ("3.1.0", True)
+        os.environ["GITHUB_REF_TYPE"] = "branch"
+        assert resolve_build_tag() == (None, False)
+    mock_run.assert_not_called()
+
+
 def test_resolve_build_tag_no_github_ref_git_describe_fails() -> None:
     """Without GITHUB_REF and git describe failing returns (None, False)."""
     with (
         patch("octopilot_pipeline_tools.tag_resolution.os.environ.get", return_value=None),
         patch("octopilot_pipeline_tools.tag_resolution.subprocess.run") as mock_run,
     ):
-        mock_run.return_value = MagicMock(returncode=128, stdout="", stderr="")
+        mock_run.return_value = MagicMock(returncode=128, stdout=b"", stderr=None)
         tag, add_latest = resolve_build_tag()
     assert tag is None
     assert add_latest is False
@@ -51,7 +65,7 @@ def test_resolve_build_tag_no_github_ref_git_describe_succeeds() -> None:
         patch("octopilot_pipeline_tools.tag_resolution.os.environ.get", return_value=None),
         patch("octopilot_pipeline_tools.tag_resolution.subprocess.run") as mock_run,
     ):
-        mock_run.return_value = MagicMock(returncode=0, stdout="v2.0.0\n", stderr="")
+        mock_run.return_value = MagicMock(returncode=0, stdout=b"v2.0.0\n", stderr=None)
         tag, add_latest = resolve_build_tag()
     assert tag == "2.0.0"
     assert add_latest is True
@@ -64,7 +78,30 @@ def test_resolve_build_tag_cwd_passed_to_git() -> None:
         patch("octopilot_pipeline_tools.tag_resolution.os.environ.get", return_value=None),
         patch("octopilot_pipeline_tools.tag_resolution.subprocess.run") as mock_run,
     ):
-        mock_run.return_value = MagicMock(returncode=128, stdout="", stderr="")
+        mock_run.return_value = MagicMock(returncode=128, stdout=b"", stderr=None)
         resolve_build_tag(cwd=cwd)
     mock_run.assert_called_once()
     assert mock_run.call_args[1]["cwd"] == cwd
+
+
+def test_resolve_build_tag_injected_env_and_runner() -> None:
+    """env and runner can be passed directly instead of patching os.environ and subprocess.run."""
+    assert resolve_build_tag(env={"GITHUB_REF": "refs/tags/v1.2.3"}) == ("1.2.3", True)
+    calls: list[list[str]] = []
+
+    def runner(args: list[str], **kwargs: object) -> subprocess.CompletedProcess[bytes]:
+        calls.append(args)
+        return subprocess.CompletedProcess(args, 0, b"v2.0.0\n")
+
+    assert resolve_build_tag(Path("/some/repo"), env={}, runner=runner) == ("2.0.0", True)
+    assert calls == [["git", "describe", "--exact-match", "--tags", "HEAD"]]
+
+
+def test_resolve_build_tag_github_ref_never_runs_git() -> None:
+    """With GITHUB_REF set (tag or branch), the result comes from the env alone."""
+
+    def runner(*args: object, **kwargs: object) -> None:
+        raise AssertionError("git must not run when GITHUB_REF is set")
+
+    assert resolve_build_tag(env={"GITHUB_REF": "refs/tags/v1.2.3"}, runner=runner) == ("1.2.3", True)
+    assert resolve_build_tag(env={"GITHUB_REF": "refs/heads/main"}, runner=runner) == (None, False)
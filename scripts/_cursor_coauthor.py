@@ -0,0 +1,35 @@
+"""Shared Cursor co-author trailer cleanup for the scripts in this directory."""
+
+from __future__ import annotations
+
+import re
+
+TRAILER = "co-authored-by: cursor <cursoragent@cursor.com>"
+
+# Cursor co-authored-by with irregular spacing; only consulted when the literal check misses
+PATTERN = re.compile(
+    r"^\s*Co-authored-by:\s*Cursor\s*<cursoragent@cursor\.com>\s*$",
+    re.IGNORECASE,
+)
+
+
+def _is_trailer(line: str) -> bool:
+    key = line.strip().lower()
+    return key == TRAILER or ("cursoragent@cursor.com" in key and PATTERN.match(line) is not None)
+
+
+def strip(msg: str) -> str:
+    """Remove the Cursor co-author trailer and collapse the blank lines it leaves."""
+    out: list[str] = []
+    blanks = 0
+    for line in msg.split("\n"):
+        if _is_trailer(line):
+            continue
+        if line:
+            blanks = 0
+        else:
+            blanks += 1
+            if blanks > 1:
+                continue
+        out.append(line)
+    return "\n".join(out).rstrip()
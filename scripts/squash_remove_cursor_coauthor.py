@@ -18,21 +18,22 @@ With --push, runs git push --force after rewriting (use with care).
 from __future__ import annotations
 
 import argparse
-import re
+import functools
+import os
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-CURSOR_COAUTHOR_PATTERN = re.compile(
-    r"^\s*Co-authored-by:\s*Cursor\s*<cursoragent@cursor\.com>\s*$",
-    re.IGNORECASE | re.MULTILINE,
-)
+from _cursor_coauthor import strip as strip_cursor_coauthor
 
+# Auto-detected repo names: exact matches, or any name starting with one of the prefixes.
+REPO_NAMES = frozenset({"octopilot-pipeline-tools"})
+REPO_PREFIXES = ("sample-",)
 
-def strip_cursor_coauthor(msg: str) -> str:
-    out = CURSOR_COAUTHOR_PATTERN.sub("", msg)
-    out = re.sub(r"\n{3,}", "\n\n", out).rstrip()
-    return out
+
+def is_target_repo_name(name: str) -> bool:
+    return name in REPO_NAMES or name.startswith(REPO_PREFIXES)
 
 
 def run(cwd: Path, *args: str, check: bool = True) -> subprocess.CompletedProcess[str]:
@@ -45,60 +46,82 @@ def run(cwd: Path, *args: str, check: bool = True) -> subprocess.CompletedProces
     )
 
 
-def get_root_commit(repo: Path) -> str:
-    r = run(repo, "git", "rev-list", "--max-parents=0", "HEAD")
-    return r.stdout.strip().splitlines()[0]
-
-
-def get_commit_count(repo: Path) -> int:
-    r = run(repo, "git", "rev-list", "--count", "HEAD")
-    return int(r.stdout.strip())
+def git_info(repo: Path) -> tuple[str, int, str]:
+    """Return (root commit, commit count, HEAD message) using two git calls."""
+    lines = run(repo, "git", "rev-list", "--parents", "HEAD").stdout.splitlines()
+    root = next(line for line in lines if " " not in line)
+    msg = run(repo, "git", "log", "-1", "--format=%B", "HEAD").stdout
+    return root, len(lines), msg
 
 
-def get_head_message(repo: Path) -> str:
-    r = run(repo, "git", "log", "-1", "--format=%B", "HEAD")
-    return r.stdout
+def rewrite_head(repo: Path, msg: str, root: str | None, push: bool) -> None:
+    """Amend HEAD with msg (after a soft reset to root, if given) and optionally push, in one shell."""
+    # --allow-empty: without it, amending fails when the rewritten commit has an empty tree
+    # (e.g. a repo whose only commit is an empty root commit)
+    script = "git commit --amend --allow-empty -F -"
+    if root:
+        script = 'git reset --soft "$1" && ' + script
+    if push:
+        script += " && git push --force"
+    subprocess.run(
+        ["sh", "-c", script, "sh", root or ""],
+        cwd=repo,
+        input=msg,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
 
 
 def _out(msg: str) -> None:
     sys.stdout.write(msg + "\n")
 
 
-def squash_and_clean(repo: Path, push: bool) -> None:
+def squash_and_clean(repo: Path, push: bool) -> tuple[bool, list[str]]:
+    """Rewrite one repo; returns (ok, log lines) so parallel runs print in order and failures are reported."""
+    log: list[str] = []
+    try:
+        _squash_and_clean(repo, push, log)
+    except (subprocess.CalledProcessError, OSError) as e:
+        detail = (getattr(e, "stderr", None) or "").strip().splitlines()
+        log.append(f"    -> FAILED in {repo}: {detail[0] if detail else e}")
+        log.append("    -> Check the local branch" + (" and the remote" if push else "") + " before re-running")
+        return False, log
+    return True, log
+
+
+def _squash_and_clean(repo: Path, push: bool, log: list[str]) -> None:
     if not (repo / ".git").exists():
-        _out(f"Skip (not a git repo): {repo}")
+        log.append(f"Skip (not a git repo): {repo}")
         return
     try:
-        root = get_root_commit(repo)
-    except (IndexError, subprocess.CalledProcessError):
-        _out(f"Skip (no commits?): {repo}")
+        root, n, msg = git_info(repo)
+    except (StopIteration, subprocess.CalledProcessError):
+        log.append(f"Skip (no commits?): {repo}")
         return
-    n = get_commit_count(repo)
     name = repo.name
-    _out(f"  {name}: {n} commit(s), root={root[:8]}")
+    log.append(f"  {name}: {n} commit(s), root={root[:8]}")
 
     if n == 1:
-        msg = get_head_message(repo)
         clean_msg = strip_cursor_coauthor(msg)
-        if clean_msg == msg:
-            _out("    -> Single commit, no Cursor line to remove")
+        # %B output ends with a newline that strip() removes; compare without it so a message
+        # with no Cursor line counts as unchanged and the commit is not rewritten
+        if clean_msg == msg.rstrip():
+            log.append("    -> Single commit, no Cursor line to remove")
             return
-        run(repo, "git", "commit", "--amend", "-m", clean_msg)
-        _out("    -> Amended single commit (removed Cursor co-author)")
+        rewrite_head(repo, clean_msg, None, push)
+        log.append("    -> Amended single commit (removed Cursor co-author)")
     else:
-        msg = get_head_message(repo)
         clean_msg = strip_cursor_coauthor(msg)
         if not clean_msg.strip():
             clean_msg = "Initial commit"
-        run(repo, "git", "reset", "--soft", root)
-        run(repo, "git", "commit", "--amend", "-m", clean_msg)
-        _out("    -> Squashed to one commit (no Cursor co-author)")
+        rewrite_head(repo, clean_msg, root, push)
+        log.append("    -> Squashed to one commit (no Cursor co-author)")
 
     if push:
-        run(repo, "git", "push", "--force")
-        _out("    -> Pushed (--force)")
+        log.append("    -> Pushed (--force)")
     else:
-        _out(f"    -> Run `git push --force` in {repo} to update remote")
+        log.append(f"    -> Run `git push --force` in {repo} to update remote")
 
 
 def main() -> int:
@@ -113,22 +136,33 @@ def main() -> int:
         repos = [Path(p).resolve() for p in args.repos]
     else:
         cwd = Path.cwd().resolve()
-        search_dirs = [cwd] if (cwd / ".git").exists() else []
-        search_dirs += [p for p in cwd.iterdir() if p.is_dir()]
         repos = []
-        for d in search_dirs:
-            if not d.is_dir() or not (d / ".git").exists():
-                continue
-            if d.name == "octopilot-pipeline-tools" or d.name.startswith("sample-"):
-                repos.append(d)
+        if is_target_repo_name(cwd.name) and (cwd / ".git").exists():
+            repos.append(cwd)
+        # scandir's entry type comes from the directory listing, so only candidates get a .git stat
+        with os.scandir(cwd) as it:
+            for entry in it:
+                if not is_target_repo_name(entry.name):
+                    continue
+                if entry.is_dir() and os.path.exists(os.path.join(entry.path, ".git")):
+                    repos.append(Path(entry.path))
         repos = sorted(set(repos))
         if not repos:
             sys.stderr.write("No repos found. Run from octopilot workspace root or pass repo paths.\n")
             return 1
 
     _out(f"Repos: {len(repos)}")
-    for repo in repos:
-        squash_and_clean(repo, args.push)
+    # Repos are independent and the work is subprocess-bound, so threads overlap the git calls.
+    # Each repo reports its own outcome, so one failure never hides what happened to the others.
+    failed = 0
+    with ThreadPoolExecutor(max_workers=min(8, len(repos))) as pool:
+        for ok, log in pool.map(functools.partial(squash_and_clean, push=args.push), repos):
+            failed += not ok
+            for line in log:
+                _out(line)
+    if failed:
+        sys.stderr.write(f"{failed} repo(s) failed; see above.\n")
+        return 1
     return 0
 
 
@@ -10,31 +10,55 @@ Use as a prepare-commit-msg hook so Cursor IDE does not add that trailer:
   chmod +x .git/hooks/prepare-commit-msg
 
 Or use globally: git config --global core.hooksPath /path/to/your/hooks
-and put this script there as prepare-commit-msg (shebang + chmod +x).
+and put the same two-line exec wrapper there as prepare-commit-msg. If you copy
+the script itself instead, copy _cursor_coauthor.py next to it as well: the hook
+imports its cleanup from that module and fails (aborting the commit) without it.
+
+To avoid starting Python on every commit, install the equivalent sh/awk hook instead:
+
+  python3 scripts/strip_cursor_coauthor.py --print-sh-hook > .git/hooks/prepare-commit-msg
+  chmod +x .git/hooks/prepare-commit-msg
 """
 
 from __future__ import annotations
 
-import re
 import sys
 
+from _cursor_coauthor import strip
+
+# Same cleanup as strip() in awk: drop the trailer, collapse runs of empty lines to one (a leading
+# one included, so git's editor template keeps its empty first line), then drop trailing whitespace.
+SH_HOOK = r"""#!/bin/sh
+# prepare-commit-msg: strip "Co-authored-by: Cursor <cursoragent@cursor.com>"
+[ -f "$1" ] || exit 0
+awk '
+BEGIN { s = "[[:space:]]*"; re = "^" s "co-authored-by:" s "cursor" s "<cursoragent@cursor[.]com>" s "$" }
+tolower($0) ~ re { next }
+$0 == "" { if (blank) next; blank = 1 }
+$0 != "" { blank = 0 }
+{ line[++n] = $0; if ($0 ~ /[^[:space:]]/) last = n }
+END {
+  if (last) sub(/[[:space:]]+$/, "", line[last])
+  for (i = 1; i <= last; i++) print line[i]
+  if (!last) print ""
+}
+' "$1" > "$1.tmp" && mv "$1.tmp" "$1"
+"""
+
 
 def main() -> None:
     if len(sys.argv) < 2:
         sys.exit(0)
+    if sys.argv[1] == "--print-sh-hook":
+        sys.stdout.write(SH_HOOK)
+        return
     path = sys.argv[1]
     try:
         with open(path) as f:
             text = f.read()
     except OSError:
         sys.exit(0)
-    # Remove Cursor co-authored-by (exact or with trailing/leading whitespace)
-    pattern = re.compile(
-        r"^\s*Co-authored-by:\s*Cursor\s*<cursoragent@cursor\.com>\s*$",
-        re.IGNORECASE | re.MULTILINE,
-    )
-    new_text = pattern.sub("", text)
-    new_text = re.sub(r"\n{3,}", "\n\n", new_text).rstrip()
+    new_text = strip(text)
     if new_text != text:
         with open(path, "w") as f:
             f.write(new_text + "\n" if new_text else "\n")